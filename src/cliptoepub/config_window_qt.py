@@ -14,12 +14,13 @@ import sys
 from pathlib import Path
 from typing import Optional, Union
 
-try:
+if __package__:
     # Normal package import (when run as cliptoepub.config_window_qt)
     from . import paths as paths
     from .llm_config import ensure_llm_config, sync_legacy_prompt
-except ImportError:
-    # Allow running as a standalone script (subprocess call with no package context)
+else:
+    # Standalone script (subprocess call with no package context): only then
+    # make the package importable, instead of failing a relative import first
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
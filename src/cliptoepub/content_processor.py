@@ -9,26 +9,148 @@ Moved under src/cliptoepub/ as part of Fase 8 to keep all core modules in the pa
 from __future__ import annotations
 
 import re
+import functools
 import html
+import hashlib
 import logging
-from typing import List, Tuple, Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Tuple, Dict, Optional
 from datetime import datetime
 from urllib.parse import urlparse
 
-import markdown2
-from striprtf.striprtf import rtf_to_text
-from bs4 import BeautifulSoup
-import requests
-from newspaper import Article
+from bs4 import BeautifulSoup, Tag
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import markdown2
+    import requests
+
+# markdown2, striprtf, requests and newspaper (which pulls in nltk) are
+# imported by the converters that need them, so detecting or converting
+# plain text does not pay for loading them.
 
 logger = logging.getLogger(__name__)
 
+# Format detection runs on every clipboard capture; compile its patterns once.
+# One alternation covers the structural tags in a single scan. Like the
+# separate patterns it replaced, "<p" has no word boundary, so <pre> counts.
+_HTML_TAG_RE = re.compile(r"<(?:html|body|div|p|span|h[1-6])[^>]*>", re.IGNORECASE)
+_ANY_TAG_RE = re.compile(r"<[^>]+>")
+_HTML_OPEN_RE = re.compile(r"<html[^>]*>", re.IGNORECASE)
+_HEAD_OPEN_RE = re.compile(r"<head\b[^>]*>", re.IGNORECASE)
+_HEAD_CLOSE_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_MD_HEADING_RE = re.compile(r"^#{1,6}\s+\S+", re.MULTILINE)
+_H1_RE = re.compile(r"<h1(?:\s[^>]*)?>(.*?)</h1\s*>", re.IGNORECASE | re.DOTALL)
+_H1_OPEN_RE = re.compile(r"<h1\b", re.IGNORECASE)
+_H1_UNSAFE_RE = re.compile(r"<!--|<script|\r|&(?!#\d+;|#[xX][0-9a-fA-F]+;|[a-zA-Z]\w*;)", re.IGNORECASE)
+# Each pattern that matches scores one point; ordered so that common
+# Markdown reaches the two-point threshold after as few scans as possible
+_MARKDOWN_PATTERNS = [
+    re.compile(p, re.MULTILINE)
+    for p in (
+        r"^#{1,6}\s+",
+        r"^\s*[-*+]\s+",
+        r"^\s*\d+\.\s+",
+        r"\*\*[^*]+\*\*",
+        r"__[^_]+__",
+        r"\*[^*]+\*",
+        r"_[^_]+_",
+        r"\[([^\]]+)\]\(([^)]+)\)",
+        r"!\[([^\]]*)\]\(([^)]+)\)",
+        r"^```",
+        r"`[^`]+`",
+        r"^>\s+",
+    )
+]
+
+
+_MARKDOWN_EXTRAS = (
+    "fenced-code-blocks",
+    "tables",
+    "strike",
+    "footnotes",
+    "smarty-pants",
+    "header-ids",
+    "code-friendly",
+)
+_markdown_local = threading.local()
+
+
+def _markdown_renderer() -> markdown2.Markdown:
+    """Return this thread's Markdown converter, creating it on first use.
+
+    markdown2.markdown() builds a new Markdown object (and sets up its
+    extras) on every call. convert() resets the per-document state, so one
+    instance can be reused, but not shared across threads.
+    """
+    md = getattr(_markdown_local, "md", None)
+    if md is None:
+        import markdown2
+
+        md = _markdown_local.md = markdown2.Markdown(extras=list(_MARKDOWN_EXTRAS))
+    return md
+
+
+# Full documents are parsed with lxml (libxml2, in C) when it is installed.
+# Chapter fragments stay on html.parser: lxml wraps a fragment in
+# <html><body>, which would leak into the re-serialized chapter.
+try:
+    import lxml  # noqa: F401
+
+    _PARSER = "lxml"
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    _PARSER = "html.parser"
+_FRAGMENT_PARSER = "html.parser"
+
+# How much of a clip the HTML/Markdown detectors look at
+DETECTION_PROBE_CHARS = 16384
+
+# (connect, read) timeouts in seconds for the plain-requests URL fallback
+HTTP_TIMEOUT = (3.05, 10)
+
+
+@functools.lru_cache(maxsize=None)
+def _http_session() -> requests.Session:
+    """Shared session so repeat fetches reuse pooled (keep-alive) connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _first_h1_text(html_content: str) -> Optional[str]:
+    """Return the text of the first <h1>, or None when there is none.
+
+    A plain-text heading is read straight from the markup; headings with
+    inline tags, comments or unusual entities go through BeautifulSoup.
+    """
+    match = _H1_RE.search(html_content)
+    if match is None:
+        if not _H1_OPEN_RE.search(html_content):
+            return None
+    elif "<" not in match.group(1) and not _H1_UNSAFE_RE.search(html_content, 0, match.end()):
+        return html.unescape(match.group(1))
+    h1 = BeautifulSoup(html_content, _PARSER).find("h1")
+    return h1.get_text() if h1 else None
+
 
 class ContentDetector:
     """Detects the format of clipboard content."""
 
     @staticmethod
     def detect_format(content: str) -> str:
+        """Classify clipboard text as url, rtf, html, markdown or plain.
+
+        URL detection looks at the whole (stripped) text, since a URL must be
+        the entire clip. The HTML and Markdown detectors only scan the first
+        DETECTION_PROBE_CHARS characters: their signatures show up early, and
+        a pasted article can run to megabytes.
+        """
         if not content:
             return "plain"
         content = content.strip()
@@ -36,9 +158,10 @@ class ContentDetector:
             return "url"
         if content.startswith("{\\rtf"):
             return "rtf"
-        if ContentDetector._is_html(content):
+        probe = content[:DETECTION_PROBE_CHARS]
+        if ContentDetector._is_html(probe):
             return "html"
-        if ContentDetector._is_markdown(content):
+        if ContentDetector._is_markdown(probe):
             return "markdown"
         return "plain"
 
@@ -46,55 +169,46 @@ class ContentDetector:
     def _is_url(text: str) -> bool:
         if "\n" in text:
             return False
+        # Cheap guard before urlparse. Prose never gets past it; the
+        # exceptions are the characters urlparse itself strips or drops
+        # (leading C0 controls, tabs, carriage returns) so results match
+        if not text[:8].lower().startswith(("http://", "https://")) and not (
+            text[:1] <= " " or "\t" in text or "\r" in text
+        ):
+            return False
         try:
             result = urlparse(text)
             return all([result.scheme in ("http", "https"), result.netloc])
         except (ValueError, AttributeError) as e:
-            logger.debug(f"Invalid URL format: {e}")
+            logger.debug("Invalid URL format: %s", e)
             return False
 
     @staticmethod
     def _is_html(text: str) -> bool:
-        html_patterns = [
-            r"<html[^>]*>",
-            r"<body[^>]*>",
-            r"<div[^>]*>",
-            r"<p[^>]*>",
-            r"<span[^>]*>",
-            r"<h[1-6][^>]*>",
-        ]
-        for pattern in html_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        if _HTML_TAG_RE.search(text):
+            return True
+        # Any three tags will do; stop scanning at the third
+        tag_count = 0
+        for _ in _ANY_TAG_RE.finditer(text):
+            tag_count += 1
+            if tag_count >= 3:
                 return True
-        tag_count = len(re.findall(r"<[^>]+>", text))
-        return tag_count >= 3
+        return False
 
     @staticmethod
     def _is_markdown(text: str) -> bool:
         # Strong signal: at least one Markdown heading at the start of a line
         # (this is enough to treat the content as Markdown, even without other markers).
-        if re.search(r"^#{1,6}\s+\S+", text, re.MULTILINE):
+        if _MD_HEADING_RE.search(text):
             return True
 
-        markdown_patterns = [
-            r"^#{1,6}\s+",
-            r"\*\*[^*]+\*\*",
-            r"__[^_]+__",
-            r"\*[^*]+\*",
-            r"_[^_]+_",
-            r"^\s*[-*+]\s+",
-            r"^\s*\d+\.\s+",
-            r"\[([^\]]+)\]\(([^)]+)\)",
-            r"!\[([^\]]*)\]\(([^)]+)\)",
-            r"^```",
-            r"`[^`]+`",
-            r"^>\s+",
-        ]
         score = 0
-        for pattern in markdown_patterns:
-            if re.search(pattern, text, re.MULTILINE):
+        for pattern in _MARKDOWN_PATTERNS:
+            if pattern.search(text):
                 score += 1
-        return score >= 2
+                if score >= 2:
+                    return True
+        return False
 
 
 class ContentConverter:
@@ -119,6 +233,8 @@ class ContentConverter:
     def _convert_url(self, url: str) -> Tuple[str, Dict]:
         metadata: Dict[str, Optional[str | list]] = {"source": url, "type": "web_article"}
         try:
+            from newspaper import Article  # type: ignore
+
             try:
                 from newspaper import Config  # type: ignore
 
@@ -152,9 +268,9 @@ class ContentConverter:
             return html_content, metadata  # type: ignore[return-value]
         except Exception:
             try:
-                response = requests.get(url, timeout=10)
+                response = _http_session().get(url, timeout=HTTP_TIMEOUT)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.text, _PARSER)
                 title = soup.find("title")
                 title_text = title.text if title else "Web Page"
                 for script in soup(["script", "style"]):
@@ -182,27 +298,21 @@ class ContentConverter:
 
     def _convert_markdown(self, content: str) -> Tuple[str, Dict]:
         metadata: Dict[str, Optional[str]] = {"type": "markdown"}
-        html_content = markdown2.markdown(
-            content,
-            extras=[
-                "fenced-code-blocks",
-                "tables",
-                "strike",
-                "footnotes",
-                "smarty-pants",
-                "header-ids",
-                "code-friendly",
-            ],
-        )
-        soup = BeautifulSoup(html_content, "html.parser")
-        h1 = soup.find("h1")
-        if h1:
-            metadata["title"] = h1.get_text()
+        html_content = _markdown_renderer().convert(content)
+        title = _first_h1_text(html_content)
+        if title is not None:
+            metadata["title"] = title
         return html_content, metadata  # type: ignore[return-value]
 
     def _convert_html(self, content: str) -> Tuple[str, Dict]:
         metadata: Dict[str, Optional[str]] = {"type": "html"}
-        soup = BeautifulSoup(content, "html.parser")
+        if _PARSER == "lxml":
+            try:
+                return self._convert_html_lxml(content, metadata)
+            except (ValueError, TypeError) as e:
+                # e.g. a str carrying an XML encoding declaration; use BeautifulSoup
+                logger.debug("lxml could not parse HTML directly: %s", e)
+        soup = BeautifulSoup(content, _PARSER)
         title = soup.find("title")
         if title:
             metadata["title"] = title.text
@@ -212,9 +322,27 @@ class ContentConverter:
         html_content = str(body) if body else str(soup)
         return html_content, metadata  # type: ignore[return-value]
 
+    @staticmethod
+    def _convert_html_lxml(content: str, metadata: Dict) -> Tuple[str, Dict]:
+        """Strip head-only and script elements on the lxml tree, without a BeautifulSoup copy."""
+        from lxml import etree
+
+        root = etree.fromstring(content, etree.HTMLParser())
+        if root is None:
+            raise ValueError("empty document")
+        title = root.find(".//title")
+        if title is not None:
+            metadata["title"] = "".join(title.itertext())
+        etree.strip_elements(root, "script", "style", "meta", "link", with_tail=False)
+        body = root.find("body")
+        html_content = etree.tostring(body if body is not None else root, encoding="unicode", method="html")
+        return html_content, metadata
+
     def _convert_rtf(self, content: str) -> Tuple[str, Dict]:
         metadata: Dict[str, str] = {"type": "rtf"}
         try:
+            from striprtf.striprtf import rtf_to_text
+
             plain_text = rtf_to_text(content)
             html_content = self._text_to_html_paragraphs(plain_text)
         except Exception:
@@ -227,18 +355,17 @@ class ContentConverter:
         return html_content, metadata  # type: ignore[return-value]
 
     def _text_to_html_paragraphs(self, text: str) -> str:
-        text = html.escape(text)
-        paragraphs = text.split("\n\n")
-        html_paragraphs: List[str] = []
-        for para in paragraphs:
-            para = para.strip()
-            if para:
-                para = para.replace("\n", "<br>")
-                html_paragraphs.append(f"<p>{para}</p>")
-        return "\n".join(html_paragraphs)
+        # Quotes are only significant inside attributes; text nodes need just &, < and >
+        text = html.escape(text, quote=False)
+        return "\n".join(
+            f"<p>{para.replace(chr(10), '<br>')}</p>"
+            for para in map(str.strip, text.split("\n\n"))
+            if para
+        )
 
     def _apply_styling(self, html_content: str) -> str:
-        if not re.search(r"<html[^>]*>", html_content, re.IGNORECASE):
+        html_open = _HTML_OPEN_RE.search(html_content)
+        if not html_open:
             styled_html = f"""
 <!DOCTYPE html>
 <html>
@@ -254,18 +381,34 @@ class ContentConverter:
 </html>
             """
         else:
-            soup = BeautifulSoup(html_content, "html.parser")
-            head = soup.find("head")
-            if not head:
-                head = soup.new_tag("head")
-                soup.html.insert(0, head)
-            style = soup.new_tag("style")
-            style.string = self.css_templates.get_default_css()
-            head.append(style)
-            styled_html = str(soup)
+            # Splice the stylesheet in as text rather than re-parsing the
+            # whole document; BeautifulSoup is only needed when the head
+            # is opened but never closed
+            style = f"<style>{self.css_templates.get_default_css()}</style>"
+            head_close = _HEAD_CLOSE_RE.search(html_content)
+            if not _HEAD_OPEN_RE.search(html_content):
+                pos = html_open.end()
+                styled_html = f"{html_content[:pos]}<head>{style}</head>{html_content[pos:]}"
+            elif head_close:
+                pos = head_close.start()
+                styled_html = f"{html_content[:pos]}{style}{html_content[pos:]}"
+            else:
+                soup = BeautifulSoup(html_content, _PARSER)
+                head = soup.find("head")
+                if not head:
+                    head = soup.new_tag("head")
+                    soup.html.insert(0, head)
+                style_tag = soup.new_tag("style")
+                style_tag.string = self.css_templates.get_default_css()
+                head.append(style_tag)
+                styled_html = str(soup)
         return styled_html
 
 
+# Elements that word-count splitting moves between chapters, in document order
+_BLOCK_TAGS = ["p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "ul", "ol"]
+
+
 class ChapterSplitter:
     """Splits long content into chapters."""
 
@@ -273,46 +416,52 @@ class ChapterSplitter:
         self.words_per_chapter = words_per_chapter
 
     def split_content(self, html_content: str, title: Optional[str] = None) -> List[Dict]:
-        soup = BeautifulSoup(html_content, "html.parser")
-        headings = soup.find_all(["h1", "h2"])
+        soup = BeautifulSoup(html_content, _PARSER)
+        # One walk collects the block elements; the chapter headings are a
+        # subset, so they need no second find_all over the tree
+        blocks = soup.find_all(_BLOCK_TAGS)
+        headings = [element for element in blocks if element.name in ("h1", "h2")]
         if len(headings) > 1:
             chapters = self._split_by_headings(soup, headings)
         else:
-            chapters = self._split_by_word_count(soup, title)
+            chapters = self._split_by_word_count(soup, title, blocks)
         return chapters
 
     def _split_by_headings(self, soup: BeautifulSoup, headings: List) -> List[Dict]:
         chapters: List[Dict] = []
-        for i, heading in enumerate(headings):
+        # Identity, not ==: Tag equality compares whole subtrees, and a list
+        # membership test made every sibling step O(headings)
+        heading_ids = {id(h) for h in headings}
+        for heading in headings:
             chapter_title = heading.get_text().strip()
             chapter_content: List[str] = []
-            current = heading
-            while current:
-                current = current.find_next_sibling()
-                if current and current in headings:
+            for sibling in heading.next_siblings:
+                if not isinstance(sibling, Tag):
+                    continue
+                if id(sibling) in heading_ids:
                     break
-                if current:
-                    chapter_content.append(str(current))
+                chapter_content.append(str(sibling))
             if chapter_content:
                 chapters.append({"title": chapter_title, "content": "\n".join(chapter_content)})
         return chapters if chapters else [{"title": "Chapter 1", "content": str(soup)}]
 
-    def _split_by_word_count(self, soup: BeautifulSoup, title: Optional[str] = None) -> List[Dict]:
-        text = soup.get_text()
-        words = text.split()
-        if len(words) <= self.words_per_chapter:
+    def _split_by_word_count(
+        self, soup: BeautifulSoup, title: Optional[str] = None, elements: Optional[List] = None
+    ) -> List[Dict]:
+        # With maxsplit, split() stops after words_per_chapter + 1 pieces, so
+        # a long document is never fully tokenized just to learn it is long
+        limit = self.words_per_chapter
+        if len(soup.get_text().split(None, limit)) <= limit:
             return [{"title": title or "Chapter 1", "content": str(soup)}]
         chapters: List[Dict] = []
         chapter_num = 1
-        elements = soup.find_all(
-            ["p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "ul", "ol"]
-        )
+        if elements is None:
+            elements = soup.find_all(_BLOCK_TAGS)
         current_chapter_content: List[str] = []
         current_word_count = 0
         for element in elements:
-            element_text = element.get_text()
-            element_word_count = len(element_text.split())
-            if current_word_count + element_word_count > self.words_per_chapter and current_chapter_content:
+            element_word_count = len(element.get_text().split())
+            if current_word_count + element_word_count > limit and current_chapter_content:
                 chapters.append(
                     {"title": f"Chapter {chapter_num}", "content": "\n".join(current_chapter_content)}
                 )
@@ -328,65 +477,77 @@ class ChapterSplitter:
         return chapters
 
 
-class TOCGenerator:
-    """Generates Table of Contents for ePub."""
-
-    def generate_toc_html(self, chapters: List[Dict], title: str = "Table of Contents") -> str:
-        toc_items: List[str] = []
-        for i, chapter in enumerate(chapters, 1):
-            chapter_title = chapter.get("title", f"Chapter {i}")
-            toc_items.append(f'<li><a href="#chapter_{i}">{html.escape(chapter_title)}</a></li>')
-        toc_html = f"""
+# TOC scaffolding, filled in with str.format so only the per-chapter
+# entries are built for each book
+_TOC_HTML_TEMPLATE = """
         <div class="toc">
-            <h1>{html.escape(title)}</h1>
+            <h1>{title}</h1>
             <nav>
                 <ul>
-                    {''.join(toc_items)}
+                    {items}
                 </ul>
             </nav>
         </div>
         """
-        return toc_html
-
-    def generate_ncx_toc(self, chapters: List[Dict], book_title: str, book_id: str) -> str:
-        nav_points: List[str] = []
-        for i, chapter in enumerate(chapters, 1):
-            chapter_title = chapter.get("title", f"Chapter {i}")
-            nav_points.append(
-                f"""
+_NCX_NAVPOINT_TEMPLATE = """
             <navPoint id="navpoint-{i}" playOrder="{i}">
                 <navLabel>
-                    <text>{html.escape(chapter_title)}</text>
+                    <text>{title}</text>
                 </navLabel>
                 <content src="chapter_{i}.xhtml"/>
             </navPoint>
             """
-            )
-        ncx_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+_NCX_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
         <!DOCTYPE ncx PUBLIC "-//NISO//DTD ncx 2005-1//EN"
          "http://www.daisy.org/z3986/2005/ncx-2005-1.dtd">
         <ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
             <head>
-                <meta name="dtb:uid" content="{html.escape(book_id)}"/>
+                <meta name="dtb:uid" content="{book_id}"/>
                 <meta name="dtb:depth" content="1"/>
                 <meta name="dtb:totalPageCount" content="0"/>
                 <meta name="dtb:maxPageNumber" content="0"/>
             </head>
             <docTitle>
-                <text>{html.escape(book_title)}</text>
+                <text>{book_title}</text>
             </docTitle>
             <navMap>
-                {''.join(nav_points)}
+                {nav_points}
             </navMap>
         </ncx>
         """
-        return ncx_content
+
+
+class TOCGenerator:
+    """Generates Table of Contents for ePub."""
+
+    @staticmethod
+    def _escaped_titles(chapters: List[Dict]) -> List[str]:
+        titles = [chapter.get("title", f"Chapter {i}") for i, chapter in enumerate(chapters, 1)]
+        return list(map(html.escape, titles))
+
+    def generate_toc_html(self, chapters: List[Dict], title: str = "Table of Contents") -> str:
+        toc_items = "".join(
+            f'<li><a href="#chapter_{i}">{chapter_title}</a></li>'
+            for i, chapter_title in enumerate(self._escaped_titles(chapters), 1)
+        )
+        return _TOC_HTML_TEMPLATE.format(title=html.escape(title), items=toc_items)
+
+    def generate_ncx_toc(self, chapters: List[Dict], book_title: str, book_id: str) -> str:
+        nav_points = "".join(
+            _NCX_NAVPOINT_TEMPLATE.format(i=i, title=chapter_title)
+            for i, chapter_title in enumerate(self._escaped_titles(chapters), 1)
+        )
+        return _NCX_TEMPLATE.format(
+            book_id=html.escape(book_id),
+            book_title=html.escape(book_title),
+            nav_points=nav_points,
+        )
 
     def add_anchors_to_chapters(self, chapters: List[Dict]) -> List[Dict]:
         updated_chapters: List[Dict] = []
         for i, chapter in enumerate(chapters, 1):
             content = chapter["content"]
-            soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, _FRAGMENT_PARSER)
             first_heading = soup.find(["h1", "h2", "h3"])
             if first_heading:
                 first_heading["id"] = f"chapter_{i}"
@@ -401,11 +562,8 @@ class TOCGenerator:
         return updated_chapters
 
 
-class CSSTemplates:
-    """Provides CSS templates for ePub styling."""
-
-    def get_default_css(self) -> str:
-        return """
+# Built-in stylesheets, used when no templates/<name>.css file is found
+_CSS_DEFAULT = """
         /* Default ePub CSS Template */
         body {
             font-family: Georgia, 'Times New Roman', serif;
@@ -486,8 +644,7 @@ class CSSTemplates:
         }
         """
 
-    def get_minimal_css(self) -> str:
-        return """
+_CSS_MINIMAL = """
         /* Minimal ePub CSS Template */
         body {
             font-family: serif;
@@ -520,8 +677,7 @@ class CSSTemplates:
         }
         """
 
-    def get_modern_css(self) -> str:
-        return """
+_CSS_MODERN = """
         /* Modern ePub CSS Template */
         /* Note: Remote font imports removed for ePub compatibility */
 
@@ -625,32 +781,76 @@ class CSSTemplates:
         }
         """
 
+_CSS = {
+    "default": _CSS_DEFAULT,
+    "minimal": _CSS_MINIMAL,
+    "modern": _CSS_MODERN,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_css_template(name: str) -> str:
+    # The template files do not change while the app runs, so each name is
+    # resolved (and read) once instead of probing the filesystem per call
+    try:
+        from pathlib import Path
+
+        here = Path(__file__).resolve()
+        candidates = [
+            here.parent / "templates" / f"{name}.css",  # if templates/ is colocated with module
+            here.parent.parent / "templates" / f"{name}.css",  # src/templates in source tree
+            here.parent.parent.parent / "templates" / f"{name}.css",  # project/bundle root templates
+        ]
+        for p in candidates:
+            try:
+                if p.exists() and p.is_file():
+                    return p.read_text(encoding="utf-8")
+            except Exception:
+                continue
+    except Exception:
+        pass
+    return _CSS.get(name, _CSS_DEFAULT)
+
+
+class CSSTemplates:
+    """Provides CSS templates for ePub styling."""
+
+    def get_default_css(self) -> str:
+        return _CSS_DEFAULT
+
+    def get_minimal_css(self) -> str:
+        return _CSS_MINIMAL
+
+    def get_modern_css(self) -> str:
+        return _CSS_MODERN
+
     def get_template(self, name: str = "default") -> str:
         """Get a CSS template by name, resolving templates/ relative to project root or bundle."""
-        try:
-            from pathlib import Path
-
-            here = Path(__file__).resolve()
-            candidates = [
-                here.parent / "templates" / f"{name}.css",  # if templates/ is colocated with module
-                here.parent.parent / "templates" / f"{name}.css",  # src/templates in source tree
-                here.parent.parent.parent / "templates" / f"{name}.css",  # project/bundle root templates
-            ]
-            for p in candidates:
-                try:
-                    if p.exists() and p.is_file():
-                        return p.read_text(encoding="utf-8")
-                except Exception:
-                    continue
-        except Exception:
-            pass
+        return _load_css_template(name)
 
-        templates = {
-            "default": self.get_default_css,
-            "minimal": self.get_minimal_css,
-            "modern": self.get_modern_css,
-        }
-        return templates.get(name, self.get_default_css)()
+
+# Detection + conversion results for recent clipboard contents, keyed by a
+# digest of the text. They do not depend on the options, so re-converting the
+# same clip with another style or chapter size skips the parse entirely.
+_CONVERSION_MEMO_SIZE = 16
+_conversion_memo: "OrderedDict[bytes, Tuple[str, str, Dict]]" = OrderedDict()
+_conversion_memo_lock = threading.Lock()
+
+
+def _memo_get(key: bytes) -> Optional[Tuple[str, str, Dict]]:
+    with _conversion_memo_lock:
+        entry = _conversion_memo.get(key)
+        if entry is not None:
+            _conversion_memo.move_to_end(key)
+        return entry
+
+
+def _memo_put(key: bytes, entry: Tuple[str, str, Dict]) -> None:
+    with _conversion_memo_lock:
+        _conversion_memo[key] = entry
+        _conversion_memo.move_to_end(key)
+        while len(_conversion_memo) > _CONVERSION_MEMO_SIZE:
+            _conversion_memo.popitem(last=False)
 
 
 def process_clipboard_content(content: str, options: Optional[Dict] = None) -> Dict:
@@ -660,10 +860,18 @@ def process_clipboard_content(content: str, options: Optional[Dict] = None) -> D
     Returns a dict with chapters, metadata, css, format, and optional toc_html.
     """
     options = options or {}
-    detector = ContentDetector()
-    format_type = detector.detect_format(content)
-    converter = ContentConverter()
-    html_content, metadata = converter.convert(content, format_type)
+    key = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    memo = _memo_get(key)
+    if memo is not None:
+        format_type, html_content, metadata = memo[0], memo[1], dict(memo[2])
+    else:
+        detector = ContentDetector()
+        format_type = detector.detect_format(content)
+        converter = ContentConverter()
+        html_content, metadata = converter.convert(content, format_type)
+        # URLs are re-fetched every time; the page may have changed
+        if format_type != "url":
+            _memo_put(key, (format_type, html_content, dict(metadata)))
     metadata["detected_format"] = format_type
     metadata["processing_date"] = datetime.now().isoformat()
 
@@ -9,18 +9,20 @@ advanced features (images, OCR, URL fetching, accumulator, caching, history).
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import queue
 import re
 import logging
 import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
-
-import pyperclip
-from ebooklib import epub
-from PIL import Image
-from pynput import keyboard
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
 
 import os
 import sys
@@ -31,18 +33,27 @@ from .content_processor import process_clipboard_content
 from .history_manager import ClipboardAccumulator, ConversionCache, ConversionHistory
 from .image_handler import ImageHandler
 from .errors import notify_error
+from .hotkeys import MultiHotkeyMatcher
 from .llm.base import LLMRequest
 from .llm.anthropic import AnthropicProvider
 from .llm.openrouter import OpenRouterProvider
 
-# Optional edit window (Tkinter may be unavailable in some Python builds)
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ebooklib import epub
+    from PIL import Image
+    from pynput import keyboard
+
+# ebooklib (lxml), pynput (display/HID connection) and pyperclip are imported
+# on first use so importing this module stays cheap.
+
+# Optional edit window (Tkinter may be unavailable in some Python builds;
+# tk_available() checks, and loads it, when the window is first wanted)
 try:  # pragma: no cover - environment dependent
-    from .edit_window import PreConversionEditor  # type: ignore
+    from .edit_window import PreConversionEditor, tk_available  # type: ignore
 except Exception as e:  # pragma: no cover - best‑effort fallback
     PreConversionEditor = None  # type: ignore[assignment]
-    logging.getLogger("ClipboardToEpub").warning(
-        f"Edit window disabled (Tkinter not available): {e}"
-    )
+    tk_available = None  # type: ignore[assignment]
+    logging.getLogger("ClipboardToEpub").warning("Edit window disabled (Tkinter not available): %s", e)
 
 # Logging
 logging.basicConfig(
@@ -54,38 +65,123 @@ logger = logging.getLogger("ClipboardToEpub")
 # Allow overriding the sync wrapper timeout (in seconds) via env var
 # to accommodate long Newspaper3k fetches or large conversions.
 SYNC_JOIN_TIMEOUT = int(os.environ.get("CLIPTOEPUB_SYNC_TIMEOUT", "120"))
+# Clipboard text longer than this (in characters) is refused before any processing
+MAX_CLIPBOARD_CHARS = int(os.environ.get("CLIPTOEPUB_MAX_CLIPBOARD_CHARS", str(16 * 1024 * 1024)))
+# Upper bound on queued hotkey jobs; each action is also queued at most once
+HOTKEY_QUEUE_SIZE = 8
+# Conversions between history file rewrites; pending entries are flushed on cleanup/exit
+HISTORY_SAVE_EVERY = 16
 # yt-dlp invocation timeout (in seconds) for YouTube subtitle downloads
 YTDLP_TIMEOUT_SECONDS = int(os.environ.get("CLIPTOEPUB_YTDLP_TIMEOUT", "120"))
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for blocking conversion work.
+
+    Converters are rebuilt whenever the apps reload their settings; sharing
+    one pool avoids spinning up (and leaking) a fresh set of threads each time.
+    Concurrency per converter is bounded by its conversion semaphore.
+    """
+    executor = ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 1), thread_name_prefix="cliptoepub")
+    atexit.register(executor.shutdown, wait=False)
+    return executor
+
+
+# Book identifiers are sliced from one urandom read per batch of 64
+_BOOK_ID_BATCH = 64
+_book_id_lock = threading.Lock()
+_book_id_pool = b""
+_book_id_offset = 0
+
+
+def _next_book_id() -> str:
+    """Return a random (version 4) UUID as hex, like ``uuid4().hex``."""
+    global _book_id_pool, _book_id_offset
+    with _book_id_lock:
+        if _book_id_offset >= len(_book_id_pool):
+            _book_id_pool = os.urandom(16 * _BOOK_ID_BATCH)
+            _book_id_offset = 0
+        raw = _book_id_pool[_book_id_offset:_book_id_offset + 16]
+        _book_id_offset += 16
+    return UUID(bytes=raw, version=4).hex
+
+
+def _is_blank(text: Optional[str]) -> bool:
+    """True for None/empty/whitespace-only text, without building a stripped copy.
+
+    str.isspace() runs in C and stops at the first visible character.
+    """
+    return not text or text.isspace()
+
+
+# \w is str.isalnum() plus "_", so this keeps exactly letters, digits, " ", "_" and "-"
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w \-]")
+
+
+def _safe_filename(title: str, limit: int = 100) -> str:
+    """Return ``title`` reduced to filesystem-safe characters, truncated to ``limit``.
+
+    The mapping is one character to one character, so truncating first gives
+    the same result without scanning the rest of a long title.
+    """
+    return _UNSAFE_FILENAME_RE.sub("_", title[:limit])
+
+
+@functools.lru_cache(maxsize=1)
+def _clipboard_backend() -> Callable[[], str]:
+    """Resolve pyperclip's clipboard backend once and return its paste function.
+
+    Backend detection probes the platform (and on Linux shells out looking for
+    xclip/xsel/wl-paste), so it is done once instead of on the first hotkey.
+    """
+    import pyperclip
+
+    _copy, paste = pyperclip.determine_clipboard()
+    return paste
+
+
+def _paste_clipboard() -> str:
+    return _clipboard_backend()()
+
+
+def _warm_clipboard_backend() -> None:
+    try:
+        _clipboard_backend()
+    except Exception as e:
+        logger.debug("Clipboard backend detection failed: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
 def _platform_hotkeys():
-    """Return default hotkey sets for the current platform.
+    """Return default hotkey combos (frozensets) for the current platform.
 
     Returns a tuple: (convert, accumulate, combine)
     """
+    from pynput import keyboard
+
     try:
         if sys.platform.startswith("win") or sys.platform.startswith("linux"):
-            convert = {keyboard.Key.ctrl, keyboard.Key.shift, keyboard.KeyCode.from_char("e")}
-            accumulate = {keyboard.Key.ctrl, keyboard.Key.shift, keyboard.KeyCode.from_char("a")}
-            combine = {keyboard.Key.ctrl, keyboard.Key.shift, keyboard.KeyCode.from_char("c")}
+            convert = frozenset({keyboard.Key.ctrl, keyboard.Key.shift, keyboard.KeyCode.from_char("e")})
+            accumulate = frozenset({keyboard.Key.ctrl, keyboard.Key.shift, keyboard.KeyCode.from_char("a")})
+            combine = frozenset({keyboard.Key.ctrl, keyboard.Key.shift, keyboard.KeyCode.from_char("c")})
         else:
-            convert = {keyboard.Key.cmd, keyboard.Key.shift, keyboard.KeyCode.from_char("e")}
-            accumulate = {keyboard.Key.cmd, keyboard.Key.shift, keyboard.KeyCode.from_char("a")}
-            combine = {keyboard.Key.cmd, keyboard.Key.shift, keyboard.KeyCode.from_char("c")}
+            convert = frozenset({keyboard.Key.cmd, keyboard.Key.shift, keyboard.KeyCode.from_char("e")})
+            accumulate = frozenset({keyboard.Key.cmd, keyboard.Key.shift, keyboard.KeyCode.from_char("a")})
+            combine = frozenset({keyboard.Key.cmd, keyboard.Key.shift, keyboard.KeyCode.from_char("c")})
         return convert, accumulate, combine
     except Exception as e:
         # Conservative fallback if certain keys are unavailable
-        logger.warning(f"Could not set platform hotkeys: {e}")
+        logger.warning("Could not set platform hotkeys: %s", e)
         return (
-            {keyboard.Key.shift, keyboard.KeyCode.from_char("e")},
-            {keyboard.Key.shift, keyboard.KeyCode.from_char("a")},
-            {keyboard.Key.shift, keyboard.KeyCode.from_char("c")},
+            frozenset({keyboard.Key.shift, keyboard.KeyCode.from_char("e")}),
+            frozenset({keyboard.Key.shift, keyboard.KeyCode.from_char("a")}),
+            frozenset({keyboard.Key.shift, keyboard.KeyCode.from_char("c")}),
         )
 
 
 # Defaults
 DEFAULT_OUTPUT_DIR = paths.get_default_output_dir()
-DEFAULT_CONVERT_HOTKEY, DEFAULT_ACCUMULATE_HOTKEY, DEFAULT_COMBINE_HOTKEY = _platform_hotkeys()
 
 
 class ClipboardToEpubConverter:
@@ -105,6 +201,7 @@ class ClipboardToEpubConverter:
         hotkey_combo: Optional[set] = None,
         max_async_workers: int = 3,
         max_concurrent_conversions: Optional[int] = None,
+        max_clipboard_chars: Optional[int] = None,
         # YouTube subtitles + LLM
         youtube_langs: Optional[List[str]] = None,
         youtube_prefer_native: bool = True,
@@ -121,6 +218,7 @@ class ClipboardToEpubConverter:
         anthropic_retry_count: int = 10,
     ) -> None:
         self.output_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
+        self._verified_output_dir: Optional[Path] = None
         self.default_author = default_author
         self.default_language = default_language
         self.default_style = default_style
@@ -129,17 +227,20 @@ class ClipboardToEpubConverter:
         self.enable_cache = enable_cache
         self.enable_history = enable_history
         self.enable_edit_window = enable_edit_window
+        # No longer sizes a worker pool (conversions share one event loop and the
+        # module-wide executor); kept for existing configs as the fallback limit
+        # on concurrent conversions
         self.max_async_workers = max_async_workers
         self.max_concurrent_conversions = int(max_concurrent_conversions or max_async_workers)
+        self.max_clipboard_chars = int(max_clipboard_chars or MAX_CLIPBOARD_CHARS)
 
         # Hotkeys
-        self.convert_hotkey = hotkey_combo or DEFAULT_CONVERT_HOTKEY
-        self.accumulate_hotkey = DEFAULT_ACCUMULATE_HOTKEY
-        self.combine_hotkey = DEFAULT_COMBINE_HOTKEY
+        # Platform defaults need pynput; they are resolved on first access
+        self._hotkey_combo = hotkey_combo
 
         # Components
         self.image_handler = ImageHandler(enable_ocr=enable_ocr, optimize_images=True)
-        self.history = ConversionHistory() if enable_history else None
+        self.history = ConversionHistory(save_every=HISTORY_SAVE_EVERY) if enable_history else None
         self.accumulator = ClipboardAccumulator(max_clips=50)
         self.cache = ConversionCache() if enable_cache else None
 
@@ -161,6 +262,8 @@ class ClipboardToEpubConverter:
 
         # LLM config for YouTube flow
         self.llm_provider = (llm_provider or "openrouter").strip().lower()
+        self._llm_providers: Dict[str, Any] = {}
+        self._llm_providers_lock = threading.Lock()
         self.anthropic_api_key = anthropic_api_key or ""
         self.openrouter_api_key = openrouter_api_key or ""
         self.anthropic_model = anthropic_model or "anthropic/claude-sonnet-4.5"
@@ -171,8 +274,10 @@ class ClipboardToEpubConverter:
         self.anthropic_retry_count = int(anthropic_retry_count or 10)
 
         # Listener state
-        self.current_keys: set = set()
         self.listener: Optional[keyboard.Listener] = None
+        self._hotkey_matcher = MultiHotkeyMatcher(())
+        # Indexed like the combos passed to the matcher in start_listening()
+        self._hotkey_actions = (self._on_convert_hotkey, self._on_accumulate_hotkey, self._on_combine_hotkey)
         self.listening: bool = False
 
         # Callbacks
@@ -181,28 +286,92 @@ class ClipboardToEpubConverter:
         self.activity_callback = None
 
         # Concurrency primitives and async executor
-        self.executor = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        # Event loop thread for the sync wrappers, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
         self._conversion_semaphore = threading.BoundedSemaphore(value=self.max_concurrent_conversions)
         self._activity_lock = threading.Lock()
         self._active_conversions = 0
         self._queued_conversions = 0
+        # (digest, path) of the last clipboard capture, to skip identical re-presses
+        self._last_capture: Optional[Tuple[bytes, str]] = None
+        # Sizes reported by the writer, keyed by path, for the history entry
+        self._written_sizes: Dict[str, int] = {}
+
+        # Hotkey actions run on a dedicated worker so listener callbacks return immediately
+        self._jobs: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue(maxsize=HOTKEY_QUEUE_SIZE)
+        self._job_worker: Optional[threading.Thread] = None
+        # Names of jobs queued or running; a repeated hotkey for the same action is dropped
+        self._pending_jobs: Set[str] = set()
+        self._pending_lock = threading.Lock()
 
         self._ensure_output_dir()
         self._setup_async()
+        self._start_job_worker()
+
+    @property
+    def convert_hotkey(self):
+        return self._hotkey_combo or _platform_hotkeys()[0]
+
+    @property
+    def accumulate_hotkey(self):
+        return _platform_hotkeys()[1]
+
+    @property
+    def combine_hotkey(self):
+        return _platform_hotkeys()[2]
 
     # --------- Setup ---------
     def _ensure_output_dir(self) -> None:
+        # Only touch the filesystem when output_dir is new or has been reassigned
+        if self._verified_output_dir == self.output_dir:
+            return
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Output directory: {self.output_dir}")
+        self._verified_output_dir = self.output_dir
+        logger.info("Output directory: %s", self.output_dir)
 
     def _setup_async(self) -> None:
-        try:
-            from concurrent.futures import ThreadPoolExecutor
+        self.executor = _shared_executor()
+        logger.debug("Using shared async executor")
 
-            self.executor = ThreadPoolExecutor(max_workers=self.max_async_workers)
-            logger.info(f"Async executor initialized with {self.max_async_workers} workers")
-        except Exception as e:
-            logger.error(f"Failed to setup async executor: {e}")
+    def _start_job_worker(self) -> None:
+        self._job_worker = threading.Thread(target=self._run_jobs, name="cliptoepub-hotkey-worker", daemon=True)
+        self._job_worker.start()
+
+    def _run_jobs(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            try:
+                job()
+            except Exception as e:
+                logger.error("Hotkey job failed: %s", e)
+
+    def _submit_job(self, name: str, fn: Callable[[], None]) -> bool:
+        """Queue ``fn`` on the hotkey worker unless a job named ``name`` is pending."""
+        with self._pending_lock:
+            if name in self._pending_jobs:
+                logger.debug("Ignoring %s: already pending", name)
+                return False
+            self._pending_jobs.add(name)
+
+        def job() -> None:
+            try:
+                fn()
+            finally:
+                with self._pending_lock:
+                    self._pending_jobs.discard(name)
+
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full:
+            with self._pending_lock:
+                self._pending_jobs.discard(name)
+            logger.warning("Hotkey queue full; dropping %s", name)
+            return False
+        return True
 
     # --------- Public API ---------
     def get_activity(self) -> Dict[str, int]:
@@ -231,41 +400,55 @@ class ClipboardToEpubConverter:
         with self._activity_lock:
             self._active_conversions = max(0, self._active_conversions + int(delta))
         self._emit_activity()
-    def convert_clipboard_content(self, use_accumulator: bool = False, llm_overrides: Optional[Dict[str, Any]] = None) -> Optional[str]:
-        """Synchronous wrapper around the async conversion method."""
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the converter's long-lived event loop, starting it on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._run_event_loop, args=(loop,), name="cliptoepub-event-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
         try:
-            # If an event loop is already running, run the async conversion in a worker thread
-            try:
-                asyncio.get_running_loop()
-                loop_running = True
-            except RuntimeError:
-                loop_running = False
+            loop.run_forever()
+        finally:
+            loop.close()
 
-            if loop_running:
-                result: Dict[str, Optional[str]] = {"path": None}
-                error: Dict[str, Optional[BaseException]] = {"e": None}
+    def _run_sync(self, make_coro: Callable[[], Any]) -> Optional[str]:
+        """Run the coroutine built by ``make_coro`` to completion from sync code.
 
-                def _runner():
-                    try:
-                        result["path"] = asyncio.run(
-                            self.convert_clipboard_content_async(use_accumulator=use_accumulator, llm_overrides=llm_overrides)
-                        )
-                    except BaseException as e:  # propagate fatal exceptions
-                        error["e"] = e
-
-                t = threading.Thread(target=_runner, daemon=True)
-                t.start()
-                t.join(timeout=SYNC_JOIN_TIMEOUT)
-                if t.is_alive():
-                    logger.error(f"Conversion timed out after {SYNC_JOIN_TIMEOUT} seconds")
-                    return None
-                if error["e"] is not None:
-                    raise error["e"]
-                return result["path"]
+        The coroutine runs on the converter's background event loop, so no loop
+        is built per call. When the caller itself runs an event loop, the wait
+        is bounded by SYNC_JOIN_TIMEOUT.
+        """
+        try:
+            asyncio.get_running_loop()
+            timeout: Optional[float] = SYNC_JOIN_TIMEOUT
+        except RuntimeError:
+            timeout = None
+
+        future = asyncio.run_coroutine_threadsafe(make_coro(), self._event_loop())
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            logger.error("Conversion timed out after %s seconds", SYNC_JOIN_TIMEOUT)
+            return None
 
-            return asyncio.run(self.convert_clipboard_content_async(use_accumulator=use_accumulator, llm_overrides=llm_overrides))
+    def convert_clipboard_content(self, use_accumulator: bool = False, llm_overrides: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Synchronous wrapper around the async conversion method."""
+        try:
+            return self._run_sync(
+                lambda: self.convert_clipboard_content_async(use_accumulator=use_accumulator, llm_overrides=llm_overrides)
+            )
         except Exception as e:
-            logger.error(f"Error in sync conversion: {e}")
+            logger.error("Error in sync conversion: %s", e)
             try:
                 notify_error(self.error_callback, "Conversion Error", str(e), severity="error")
             except Exception:
@@ -275,37 +458,11 @@ class ClipboardToEpubConverter:
     def convert_text_to_epub(self, text: str, suggested_title: Optional[str] = None, tags: Optional[List[str]] = None) -> Optional[str]:
         """Convert provided text directly to ePub, bypassing clipboard detection."""
         try:
-            try:
-                asyncio.get_running_loop()
-                loop_running = True
-            except RuntimeError:
-                loop_running = False
-
-            if loop_running:
-                result: Dict[str, Optional[str]] = {"path": None}
-                error: Dict[str, Optional[BaseException]] = {"e": None}
-
-                def _runner():
-                    try:
-                        result["path"] = asyncio.run(
-                            self.convert_text_to_epub_async(text, suggested_title=suggested_title, tags=tags)
-                        )
-                    except BaseException as e:  # propagate fatal exceptions
-                        error["e"] = e
-
-                t = threading.Thread(target=_runner, daemon=True)
-                t.start()
-                t.join(timeout=SYNC_JOIN_TIMEOUT)
-                if t.is_alive():
-                    logger.error(f"Conversion timed out after {SYNC_JOIN_TIMEOUT} seconds")
-                    return None
-                if error["e"] is not None:
-                    raise error["e"]
-                return result["path"]
-
-            return asyncio.run(self.convert_text_to_epub_async(text, suggested_title=suggested_title, tags=tags))
+            return self._run_sync(
+                lambda: self.convert_text_to_epub_async(text, suggested_title=suggested_title, tags=tags)
+            )
         except Exception as e:
-            logger.error(f"Error converting provided text: {e}")
+            logger.error("Error converting provided text: %s", e)
             try:
                 notify_error(self.error_callback, "Conversion Error", str(e), severity="error", context={"mode": "direct_text"})
             except Exception:
@@ -321,7 +478,7 @@ class ClipboardToEpubConverter:
             self._inc_active(1)
             acquired = True
         try:
-            if not text or not text.strip():
+            if _is_blank(text):
                 logger.warning("No text provided for direct conversion")
                 return None
 
@@ -343,7 +500,7 @@ class ClipboardToEpubConverter:
                         "title": processed.get("metadata", {}).get("title", suggested_title or "Untitled"),
                         "format": processed.get("format", "unknown"),
                         "chapters": len(processed.get("chapters", [])),
-                        "size": Path(path).stat().st_size,
+                        "size": self._written_size(path),
                         "author": self.default_author,
                         "tags": list(tags) if tags else [],
                     }
@@ -353,7 +510,7 @@ class ClipboardToEpubConverter:
 
             return path
         except Exception as e:
-            logger.error(f"Error in direct text conversion: {e}", exc_info=True)
+            logger.exception("Error in direct text conversion: %s", e)
             return None
         finally:
             if acquired:
@@ -364,9 +521,20 @@ class ClipboardToEpubConverter:
         if self.listening:
             return
 
+        from pynput import keyboard
+
         self.listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)
+        # All three combos share one pressed-key bitmask; keys are canonicalized so
+        # left/right modifiers and shifted characters match the configured combo.
+        canonical = self.listener.canonical
+        self._hotkey_matcher = MultiHotkeyMatcher(
+            [canonical(k) for k in combo]
+            for combo in (self.convert_hotkey, self.accumulate_hotkey, self.combine_hotkey)
+        )
         self.listener.start()
         self.listening = True
+        # Detect the clipboard backend in the background before the first hotkey
+        self._submit_job("warm_clipboard", _warm_clipboard_backend)
 
         def _label(combo: set) -> str:
             def fmt(k):
@@ -376,11 +544,13 @@ class ClipboardToEpubConverter:
 
             return "+".join(sorted(fmt(k) for k in combo))
 
-        logger.info("Started listening for hotkeys")
-        logger.info(f"  Convert: {_label(self.convert_hotkey)}")
-        logger.info(f"  Accumulate: {_label(self.accumulate_hotkey)}")
-        logger.info(f"  Combine: {_label(self.combine_hotkey)}")
-        logger.info("  Stop: ESC")
+        # One record for the whole banner: a single handler write instead of five
+        logger.info(
+            "Started listening for hotkeys\n  Convert: %s\n  Accumulate: %s\n  Combine: %s\n  Stop: ESC",
+            _label(self.convert_hotkey),
+            _label(self.accumulate_hotkey),
+            _label(self.combine_hotkey),
+        )
 
     def stop_listening(self) -> None:
         if self.listening and self.listener:
@@ -390,16 +560,16 @@ class ClipboardToEpubConverter:
 
     def accumulate_current_clip(self) -> None:
         try:
-            content = pyperclip.paste()
-            if content and content.strip():
+            content = _paste_clipboard()
+            if not _is_blank(content):
                 clip = self.accumulator.add_clip(content)
-                logger.info(f"Added clip to accumulator: {clip['id']}")
+                logger.info("Added clip to accumulator: %s", clip["id"])
                 if self.conversion_callback:
                     self.conversion_callback(f"accumulator:{clip['id']}")
             else:
                 logger.warning("No content to accumulate")
         except Exception as e:
-            logger.error(f"Error accumulating clip: {e}")
+            logger.error("Error accumulating clip: %s", e)
 
     def combine_accumulated_clips(self) -> None:
         path = self.convert_clipboard_content(use_accumulator=True)
@@ -451,8 +621,21 @@ class ClipboardToEpubConverter:
                 else:
                     content = clipboard_content or await self._get_clipboard_content_async()
                     metadata = {}
+                    size = len(content or "")
+                    if size > self.max_clipboard_chars:
+                        logger.warning("Clipboard too large (%d chars, limit %d); skipping", size, self.max_clipboard_chars)
+                        try:
+                            notify_error(
+                                self.error_callback,
+                                "Clipboard Too Large",
+                                f"Clipboard has {size:,} characters; the limit is {self.max_clipboard_chars:,}.",
+                                severity="warning",
+                            )
+                        except Exception:
+                            pass
+                        return None
 
-                if not content or not str(content).strip():
+                if _is_blank(content):
                     # Fallback: check for image if no textual content
                     try:
                         image = self.image_handler.detect_image_in_clipboard()
@@ -466,7 +649,12 @@ class ClipboardToEpubConverter:
 
                 # Optional edit window first so user changes affect processing and caching.
                 # Only enabled when Tkinter edit window is available.
-                if self.enable_edit_window and PreConversionEditor is not None and not use_accumulator:
+                if (
+                    self.enable_edit_window
+                    and not use_accumulator
+                    and PreConversionEditor is not None
+                    and tk_available()
+                ):
                     edited_content, edited_meta = await self._show_edit_window_async(content, metadata)
                     if edited_content:
                         content = edited_content
@@ -488,12 +676,24 @@ class ClipboardToEpubConverter:
                     "css_template": css_template,
                 }
 
+                # Identical re-press: the previous ePub for this exact capture still exists
+                capture_digest: Optional[bytes] = None
+                if not use_accumulator and not llm_overrides:
+                    capture_digest = self._capture_digest(content, options, metadata)
+                    last = self._last_capture
+                    if last and last[0] == capture_digest and os.path.exists(last[1]):
+                        logger.info("Clipboard unchanged since last capture; reusing %s", Path(last[1]).name)
+                        return last[1]
+
                 # Cache check (after potential edits so we do not skip user's changes)
                 if self.cache:
                     cached = self.cache.get(content, options)
                     if cached:
                         logger.info("Using cached conversion result")
-                        return await self._create_epub_from_cached_async(cached)
+                        path = await self._create_epub_from_cached_async(cached)
+                        if path and capture_digest:
+                            self._last_capture = (capture_digest, path)
+                        return path
 
                 # Special case: If content is a bare YouTube URL, fetch subtitles and route via LLM
                 if (
@@ -510,9 +710,7 @@ class ClipboardToEpubConverter:
                             return path
                         logger.info("YouTube pipeline did not produce an ePub; falling back to generic processing")
                     except Exception as e:
-                        logger.warning(
-                            f"YouTube path failed; falling back to generic processing: {e}"
-                        )
+                        logger.warning("YouTube path failed; falling back to generic processing: %s", e)
 
                 # Process content (thread pool)
                 loop = asyncio.get_running_loop()
@@ -522,6 +720,8 @@ class ClipboardToEpubConverter:
 
                 # Create ePub
                 path = await self._create_epub_async(processed, metadata)
+                if path and capture_digest:
+                    self._last_capture = (capture_digest, path)
 
                 # Cache store
                 if self.cache and path:
@@ -533,14 +733,14 @@ class ClipboardToEpubConverter:
                         "title": processed.get("metadata", {}).get("title", "Untitled"),
                         "format": processed.get("format", "unknown"),
                         "chapters": len(processed.get("chapters", [])),
-                        "size": Path(path).stat().st_size,
+                        "size": self._written_size(path),
                         "author": self.default_author,
                     }
                     self.history.add_entry(path, hist_meta)
 
                 return path
             except Exception as e:
-                logger.error(f"Error in async conversion: {e}", exc_info=True)
+                logger.exception("Error in async conversion: %s", e)
                 try:
                     notify_error(self.error_callback, "Conversion Error", str(e), severity="error")
                 except Exception:
@@ -550,9 +750,39 @@ class ClipboardToEpubConverter:
             self._inc_active(-1)
             self._release_conversion_slot()
 
+    async def _write_epub_async(self, filepath: Path, book: "epub.EpubBook") -> int:
+        """Encode ``book`` on the executor, then write it without holding a worker."""
+        from . import epub_writer
+
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(self.executor, epub_writer.epub_bytes, book)
+        try:
+            import aiofiles  # type: ignore
+        except ImportError:
+            await loop.run_in_executor(self.executor, filepath.write_bytes, data)
+        else:
+            async with aiofiles.open(filepath, "wb") as fh:
+                await fh.write(data)
+        return len(data)
+
+    def _remember_size(self, filepath: Path, size: int) -> None:
+        # Only kept for the history entry that follows the write
+        if self.history:
+            self._written_sizes[str(filepath)] = size
+
+    def _written_size(self, path: str) -> int:
+        size = self._written_sizes.pop(path, None)
+        return os.path.getsize(path) if size is None else size
+
+    @staticmethod
+    def _capture_digest(content: str, options: Dict[str, Any], metadata: Dict[str, Any]) -> bytes:
+        h = hashlib.blake2b(str(content).encode("utf-8", errors="ignore"), digest_size=16)
+        h.update(json.dumps([options, metadata], sort_keys=True, default=str).encode("utf-8"))
+        return h.digest()
+
     async def _get_clipboard_content_async(self) -> str:
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, pyperclip.paste)
+        return await loop.run_in_executor(None, _paste_clipboard)
 
     # --------- YouTube subtitles + LLM helpers ---------
     @staticmethod
@@ -599,7 +829,7 @@ class ClipboardToEpubConverter:
             reported_error = True
             transcript_text = None
 
-        if not transcript_text or not transcript_text.strip():
+        if _is_blank(transcript_text):
             logger.info("No subtitles retrieved for YouTube URL: %s", url)
             if not reported_error:
                 try:
@@ -635,7 +865,7 @@ class ClipboardToEpubConverter:
                 llm_overrides or {},
             )
         except Exception as e:
-            logger.error("LLM processing failed for YouTube URL %s: %s", url, e, exc_info=True)
+            logger.exception("LLM processing failed for YouTube URL %s: %s", url, e)
             try:
                 notify_error(
                     self.error_callback,
@@ -648,7 +878,7 @@ class ClipboardToEpubConverter:
                 pass
             md = None
 
-        if not md or not md.strip():
+        if _is_blank(md):
             logger.warning("Empty LLM result; converting transcript directly")
             return await self.convert_text_to_epub_async(transcript_text, suggested_title="YouTube Transcript", tags=["youtube", "subtitles"], acquire_conversion_slot=False)  # type: ignore[arg-type]
 
@@ -670,7 +900,7 @@ class ClipboardToEpubConverter:
             # Offload potentially blocking semaphore acquire to a worker thread
             await loop.run_in_executor(None, self._conversion_semaphore.acquire)
         except Exception as e:
-            logger.error(f"Failed to acquire conversion slot: {e}")
+            logger.error("Failed to acquire conversion slot: %s", e)
             try:
                 notify_error(self.error_callback, "Internal Error", f"Could not acquire conversion slot: {e}", severity="warning")
             except Exception:
@@ -732,7 +962,7 @@ class ClipboardToEpubConverter:
             except FileNotFoundError:
                 raise RuntimeError("yt-dlp not found. Install it with 'pip install yt-dlp' or via Homebrew.")
             except Exception as e:
-                logger.debug(f"yt-dlp run error: {e}")
+                logger.debug("yt-dlp run error: %s", e)
                 return False
 
         # Helper: locate a newly created subtitle file, prefer vtt then srt
@@ -770,7 +1000,7 @@ class ClipboardToEpubConverter:
                 sub_path = find_new_sub(lang)
                 if sub_path and sub_path.exists():
                     subs_text = self._parse_subtitle_file(sub_path)
-                    if subs_text and subs_text.strip():
+                    if not _is_blank(subs_text):
                         break
                 # Auto next
                 args = [*common, "--write-auto-subs", "--sub-langs", lang, url]
@@ -778,7 +1008,7 @@ class ClipboardToEpubConverter:
                 sub_path = find_new_sub(lang)
                 if sub_path and sub_path.exists():
                     subs_text = self._parse_subtitle_file(sub_path)
-                    if subs_text and subs_text.strip():
+                    if not _is_blank(subs_text):
                         break
             else:
                 # Auto first
@@ -787,7 +1017,7 @@ class ClipboardToEpubConverter:
                 sub_path = find_new_sub(lang)
                 if sub_path and sub_path.exists():
                     subs_text = self._parse_subtitle_file(sub_path)
-                    if subs_text and subs_text.strip():
+                    if not _is_blank(subs_text):
                         break
                 # Native next
                 args = [*common, "--write-subs", "--sub-langs", lang, url]
@@ -795,7 +1025,7 @@ class ClipboardToEpubConverter:
                 sub_path = find_new_sub(lang)
                 if sub_path and sub_path.exists():
                     subs_text = self._parse_subtitle_file(sub_path)
-                    if subs_text and subs_text.strip():
+                    if not _is_blank(subs_text):
                         break
 
         # Cleanup temp dir; keep errors silent
@@ -863,16 +1093,25 @@ class ClipboardToEpubConverter:
         text = re.sub(r"\s+", " ", text)
         return text.strip()
 
+    def _llm_provider_for(self, name: str, factory: Callable[[], Any]) -> Any:
+        # Providers are kept for the converter's lifetime so their HTTP
+        # client's keep-alive connections carry over between requests
+        with self._llm_providers_lock:
+            provider = self._llm_providers.get(name)
+            if provider is None:
+                provider = self._llm_providers[name] = factory()
+            return provider
+
     def _llm_process_blocking(self, text: str, llm_overrides: Optional[Dict[str, Any]] = None) -> str:
         # Route based on provider + available key
         provider_name = (self.llm_provider or "anthropic").strip().lower()
         if provider_name == "openrouter":
-            provider = OpenRouterProvider()
+            provider = self._llm_provider_for("openrouter", OpenRouterProvider)
             # Prefer environment variable, fall back to stored config
             api_key = os.environ.get("OPENROUTER_API_KEY", "") or (self.openrouter_api_key or "").strip()
             model = self.anthropic_model or "anthropic/claude-sonnet-4.5"
         else:
-            provider = AnthropicProvider()
+            provider = self._llm_provider_for("anthropic", AnthropicProvider)
             # Prefer environment variable, fall back to stored config
             api_key = os.environ.get("ANTHROPIC_API_KEY", "") or (self.anthropic_api_key or "").strip()
             # Use Anthropic-native model ids for this provider
@@ -923,7 +1162,7 @@ class ClipboardToEpubConverter:
                     "title": image_data["title"],
                     "format": "image",
                     "chapters": 1,
-                    "size": Path(path).stat().st_size,
+                    "size": self._written_size(path),
                     "author": self.default_author,
                     "tags": tags,
                 }
@@ -931,7 +1170,7 @@ class ClipboardToEpubConverter:
 
             return path
         except Exception as e:
-            logger.error(f"Error converting image: {e}", exc_info=True)
+            logger.exception("Error converting image: %s", e)
             try:
                 notify_error(self.error_callback, "Image Conversion Error", str(e), severity="error")
             except Exception:
@@ -939,27 +1178,41 @@ class ClipboardToEpubConverter:
             return None
 
     async def _show_edit_window_async(self, content: str, metadata: Dict[str, Any]):
-        result = {"content": None, "metadata": None}
-        event = threading.Event()
+        loop = asyncio.get_running_loop()
+        # The GUI thread reports back through this future; no worker blocks waiting
+        done: "asyncio.Future[Tuple[Optional[str], Optional[Dict[str, Any]]]]" = loop.create_future()
+
+        answered = False
+
+        def _resolve(value):
+            if not done.done():
+                done.set_result(value)
+
+        def _answer(value):
+            nonlocal answered
+            if not answered:
+                answered = True
+                loop.call_soon_threadsafe(_resolve, value)
 
         def on_convert(edited_content, edited_metadata):
-            result["content"] = edited_content
-            result["metadata"] = edited_metadata
-            event.set()
+            _answer((edited_content, edited_metadata))
 
         def on_cancel():
-            event.set()
+            _answer((None, None))
 
         def show_window():
-            editor = PreConversionEditor(content=content, metadata=metadata, on_convert=on_convert, on_cancel=on_cancel)
-            editor.run()
+            try:
+                editor = PreConversionEditor(content=content, metadata=metadata, on_convert=on_convert, on_cancel=on_cancel)
+                editor.run()
+            finally:
+                # A window that closed without either callback counts as cancelled
+                _answer((None, None))
 
         t = threading.Thread(target=show_window)
         t.start()
 
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, event.wait)
-        return result["content"], result["metadata"] or {}
+        edited_content, edited_metadata = await done
+        return edited_content, edited_metadata or {}
 
     async def _create_epub_from_cached_async(self, cached: Dict[str, Any]) -> Optional[str]:
         try:
@@ -973,9 +1226,12 @@ class ClipboardToEpubConverter:
                 logger.warning("Cached data has no chapters")
                 return None
 
+            # One timestamp feeds both the fallback title and the filename
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
             # Prepare normalized metadata for book assembly
             meta: Dict[str, Any] = {
-                "title": proc_metadata.get("title") or f'Clipboard_{datetime.now().strftime("%Y%m%d_%H%M%S")}',
+                "title": proc_metadata.get("title") or f"Clipboard_{timestamp[:15]}",
                 "language": proc_metadata.get("language", self.default_language),
                 "authors": proc_metadata.get("authors") or [self.default_author],
                 "date": proc_metadata.get("date"),
@@ -983,22 +1239,24 @@ class ClipboardToEpubConverter:
                 "source": proc_metadata.get("source"),
             }
 
-            book = self._assemble_epub_book(meta=meta, chapters=chapters, css_style=css_style, format_type=format_type, toc_html=toc_html)
+            book = await self._assemble_epub_book_async(
+                meta=meta, chapters=chapters, css_style=css_style, format_type=format_type, toc_html=toc_html
+            )
 
             # Persist to disk with a clear suffix to indicate cache usage
             title = meta["title"]
-            safe_title = "".join(c if c.isalnum() or c in (" ", "_", "-") else "_" for c in title)[:100]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            safe_title = _safe_filename(title)
             filename = f"{safe_title}_{timestamp}_cached.epub"
+            self._ensure_output_dir()
             filepath = self.output_dir / filename
 
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(self.executor, epub.write_epub, str(filepath), book, {})
+            size = await self._write_epub_async(filepath, book)
+            self._remember_size(filepath, size)
 
-            logger.info(f"ePub created from cache: {filename}")
+            logger.info("ePub created from cache: %s", filename)
             return str(filepath)
         except Exception as e:
-            logger.error(f"Error creating ePub from cache: {e}", exc_info=True)
+            logger.exception("Error creating ePub from cache: %s", e)
             try:
                 notify_error(self.error_callback, "EPUB Error", f"Cache path failed: {e}", severity="error")
             except Exception:
@@ -1017,8 +1275,11 @@ class ClipboardToEpubConverter:
                 logger.warning("No chapters to convert")
                 return None
 
+            # One timestamp feeds both the fallback title and the filename
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
             # Normalize metadata precedence: explicit "metadata" overrides processed metadata
-            title = metadata.get("title") or proc_metadata.get("title") or f'Clipboard_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+            title = metadata.get("title") or proc_metadata.get("title") or f"Clipboard_{timestamp[:15]}"
             authors = metadata.get("authors") or proc_metadata.get("authors") or [self.default_author]
             language = metadata.get("language", self.default_language)
             merged = {**proc_metadata, **metadata}
@@ -1032,26 +1293,25 @@ class ClipboardToEpubConverter:
                 "source": merged.get("source"),
             }
 
-            book = self._assemble_epub_book(meta=meta, chapters=chapters, css_style=css_style, format_type=format_type, toc_html=toc_html)
+            book = await self._assemble_epub_book_async(
+                meta=meta, chapters=chapters, css_style=css_style, format_type=format_type, toc_html=toc_html
+            )
 
-            safe_title = "".join(c if c.isalnum() or c in (" ", "_", "-") else "_" for c in title)[:100]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            safe_title = _safe_filename(title)
             filename = f"{safe_title}_{timestamp}.epub"
+            self._ensure_output_dir()
             filepath = self.output_dir / filename
 
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(self.executor, epub.write_epub, str(filepath), book, {})
+            size = await self._write_epub_async(filepath, book)
+            self._remember_size(filepath, size)
 
-            logger.info(f"ePub created: {filename}")
-            logger.info(f"   Format: {format_type}")
-            logger.info(f"   Chapters: {len(chapters)}")
-            try:
-                logger.info(f"   Size: {filepath.stat().st_size / 1024:.2f} KB")
-            except Exception:
-                pass
+            logger.info("ePub created: %s", filename)
+            logger.info("   Format: %s", format_type)
+            logger.info("   Chapters: %s", len(chapters))
+            logger.info("   Size: %.2f KB", size / 1024)
             return str(filepath)
         except Exception as e:
-            logger.error(f"Error creating ePub: {e}", exc_info=True)
+            logger.exception("Error creating ePub: %s", e)
             try:
                 notify_error(self.error_callback, "EPUB Error", str(e), severity="error")
             except Exception:
@@ -1059,6 +1319,15 @@ class ClipboardToEpubConverter:
             return None
 
     # --------- Shared EPUB assembly ---------
+    async def _assemble_epub_book_async(self, **kwargs: Any) -> epub.EpubBook:
+        """Run _assemble_epub_book on the executor, off the event loop.
+
+        The book is built entirely within one worker, so ebooklib never sees
+        concurrent mutation; chapters render later, while the archive is encoded.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(self._assemble_epub_book, **kwargs))
+
     def _assemble_epub_book(
         self,
         *,
@@ -1074,8 +1343,12 @@ class ClipboardToEpubConverter:
         This helper centralizes the previously duplicated logic used by cached and
         non-cached creation paths to keep output consistent.
         """
+        from ebooklib import epub
+
+        from . import epub_writer
+
         book = epub.EpubBook()
-        book.set_identifier(str(uuid4()))
+        book.set_identifier(_next_book_id())
 
         title = meta.get("title") or f'Clipboard_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
         language = meta.get("language", self.default_language)
@@ -1096,79 +1369,35 @@ class ClipboardToEpubConverter:
         # Content type helps downstream readers
         book.add_metadata("DC", "type", f"clipboard_{format_type}")
 
-        # Ensure CSS content is bytes for ebooklib
-        css_bytes = (css_style or "").encode("utf-8", errors="ignore")
-        css_item = epub.EpubItem(uid="style", file_name="style.css", media_type="text/css", content=css_bytes)
-        book.add_item(css_item)
+        css_item = book.add_item(epub_writer.style_item(css_style or ""))
+        # EpubHtml renders <head> from its own links, so each page needs the
+        # stylesheet link; build it once rather than via per-page add_item()
+        style_link = {"href": css_item.get_name(), "rel": "stylesheet", "type": "text/css"}
 
         epub_items: List[Any] = []
 
         # Optional TOC page (HTML fragment or full doc)
         if toc_html:
             toc_page = epub.EpubHtml(uid="toc", file_name="toc.xhtml", title="Table of Contents")
-            page_content = (str(toc_html) or "").strip()
-            if "\x00" in page_content:
-                page_content = page_content.replace("\x00", "")
-            # Try to extract only body content when a full doc is provided
-            try:
-                inner = page_content
-                try:
-                    from bs4 import BeautifulSoup  # type: ignore
-                    soup = BeautifulSoup(page_content, 'html.parser')
-                    if soup.body:
-                        inner = soup.body.decode_contents() or inner
-                except Exception:
-                    pass
-                page_content = f"""
-<html xmlns=\"http://www.w3.org/1999/xhtml\">
-<head>
-    <meta charset=\"UTF-8\"/>
-    <title>Table of Contents</title>
-    <link rel=\"stylesheet\" type=\"text/css\" href=\"style.css\"/>
-</head>
-<body>
-    {inner}
-</body>
-</html>"""
-            except Exception:
-                page_content = "<html xmlns=\"http://www.w3.org/1999/xhtml\"><head><meta charset=\"UTF-8\"/><title>Table of Contents</title><link rel=\"stylesheet\" type=\"text/css\" href=\"style.css\"/></head><body></body></html>"
-            toc_page.content = page_content.encode("utf-8", errors="ignore")
+            # Only the body content is kept when a full doc is provided
+            toc_page.content = epub_writer.xhtml_page("Table of Contents", epub_writer.body_inner(str(toc_html)), heading=False)
+            toc_page.links.append(style_link)
             book.add_item(toc_page)
             epub_items.append(toc_page)
 
-        # Helper to wrap chapter content safely as XHTML bytes
-        def _ensure_xhtml(doc_title: str, content: str) -> bytes:
-            txt = (content or "").strip()
-            if "\x00" in txt:
-                txt = txt.replace("\x00", "")
-            inner = txt
-            try:
-                from bs4 import BeautifulSoup  # type: ignore
-                soup = BeautifulSoup(txt, 'html.parser')
-                if soup.body:
-                    inner = soup.body.decode_contents() or inner
-            except Exception:
-                pass
-            wrapped = f"""
-<html xmlns=\"http://www.w3.org/1999/xhtml\">
-<head>
-    <meta charset=\"UTF-8\"/>
-    <title>{doc_title}</title>
-    <link rel=\"stylesheet\" type=\"text/css\" href=\"style.css\"/>
-</head>
-<body>
-    <h1>{doc_title}</h1>
-    {inner}
-</body>
-</html>"""
-            return wrapped.encode("utf-8", errors="ignore")
-
+        add_item = book.add_item
+        append_item = epub_items.append
+        lazy_chapter = epub_writer.LazyChapter
         for idx, chapter in enumerate(chapters, 1):
-            title_text = str(chapter.get("title", f"Chapter {idx}"))
-            html_item = epub.EpubHtml(uid=f"chapter_{idx}", file_name=f"chapter_{idx}.xhtml", title=title_text)
-            html_item.content = _ensure_xhtml(title_text, str(chapter.get("content", "")))
-            book.add_item(html_item)
-            epub_items.append(html_item)
+            title_c = chapter.get("title")
+            title_text = f"Chapter {idx}" if title_c is None else str(title_c)
+            uid = f"chapter_{idx}"
+            html_item = lazy_chapter(
+                str(chapter.get("content", "")), uid=uid, file_name=uid + ".xhtml", title=title_text
+            )
+            html_item.links.append(style_link)
+            add_item(html_item)
+            append_item(html_item)
 
         # Spine and navigation
         book.spine = ["nav"] + epub_items
@@ -1180,23 +1409,14 @@ class ClipboardToEpubConverter:
 
     # --------- Hotkey callbacks ---------
     def _on_press(self, key):
-        self.current_keys.add(key)
-
-        if self.convert_hotkey.issubset(self.current_keys):
-            logger.info("Convert hotkey triggered")
-            self._trigger_conversion()
-        elif self.accumulate_hotkey.issubset(self.current_keys):
-            logger.info("Accumulate hotkey triggered")
-            self._trigger_accumulate()
-        elif self.combine_hotkey.issubset(self.current_keys):
-            logger.info("Combine hotkey triggered")
-            self._trigger_combine()
+        listener = self.listener
+        if listener is None:
+            return
+        for index in self._hotkey_matcher.press(listener.canonical(key)):
+            self._hotkey_actions[index]()
 
     def _on_release(self, key):
-        try:
-            self.current_keys.remove(key)
-        except KeyError:
-            pass
+        from pynput import keyboard
 
         if key == keyboard.Key.esc:
             logger.info("ESC pressed, stopping listener")
@@ -1210,34 +1430,59 @@ class ClipboardToEpubConverter:
             t.start()
             return
 
-    def _trigger_conversion(self):
-        def run():
-            path = self.convert_clipboard_content()
-            if path and self.conversion_callback:
-                self.conversion_callback(path)
+        listener = self.listener
+        if listener is None:
+            return
+        self._hotkey_matcher.release(listener.canonical(key))
 
-        t = threading.Thread(target=run, daemon=True)
-        t.start()
+    def _on_convert_hotkey(self):
+        logger.info("Convert hotkey triggered")
+        self._trigger_conversion()
+
+    def _on_accumulate_hotkey(self):
+        logger.info("Accumulate hotkey triggered")
+        self._trigger_accumulate()
+
+    def _on_combine_hotkey(self):
+        logger.info("Combine hotkey triggered")
+        self._trigger_combine()
+
+    def _trigger_conversion(self):
+        self._submit_job("convert", self._convert_and_report)
 
     def _trigger_accumulate(self):
-        t = threading.Thread(target=self.accumulate_current_clip, daemon=True)
-        t.start()
+        self._submit_job("accumulate", self.accumulate_current_clip)
 
     def _trigger_combine(self):
-        t = threading.Thread(target=self.combine_accumulated_clips, daemon=True)
-        t.start()
+        self._submit_job("combine", self.combine_accumulated_clips)
+
+    def _convert_and_report(self) -> None:
+        path = self.convert_clipboard_content()
+        if path and self.conversion_callback:
+            self.conversion_callback(path)
 
     # --------- Cleanup ---------
     def cleanup(self) -> None:
         try:
+            self._jobs.put(None)
+            with self._loop_lock:
+                loop, self._loop = self._loop, None
+            if loop is not None:
+                loop.call_soon_threadsafe(loop.stop)
+            if self.history:
+                self.history.flush()
+            with self._llm_providers_lock:
+                providers, self._llm_providers = list(self._llm_providers.values()), {}
+            for provider in providers:
+                provider.close()
             self.stop_listening()
-            if self.executor:
-                self.executor.shutdown(wait=False)
+            # The shared executor outlives this converter; it is shut down at exit
             if self.cache:
                 self.cache.cleanup_if_needed()
+                self.cache.flush()
             logger.info("Cleanup completed")
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
 
 __all__ = ["ClipboardToEpubConverter"]
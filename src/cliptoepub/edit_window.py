@@ -4,23 +4,145 @@ Pre-conversion Edit Window for Clipboard to ePub
 Provides a GUI for editing and previewing content before conversion
 """
 
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
 import logging
+import os
 import sys
-from typing import Optional, Dict, Any, Callable
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, Tuple
 from pathlib import Path
-import json
-import webbrowser
-import tempfile
+import re
 import html
+from html.parser import HTMLParser
 
 logger = logging.getLogger('EditWindow')
 
+# Tkinter (and the Tcl/Tk libraries behind it) is imported by tk_available()
+# when a window is first needed, so importing this module stays cheap
+tk: Any = None
+ttk: Any = None
+scrolledtext: Any = None
+messagebox: Any = None
+
+
+@lru_cache(maxsize=None)
+def tk_available() -> bool:
+    """Import Tkinter on first call; return False if this Python lacks it."""
+    global tk, ttk, scrolledtext, messagebox
+    try:
+        import tkinter
+        from tkinter import messagebox as _messagebox, scrolledtext as _scrolledtext, ttk as _ttk
+    except Exception as e:
+        logger.warning("Edit window disabled (Tkinter not available): %s", e)
+        return False
+    tk, ttk, scrolledtext, messagebox = tkinter, _ttk, _scrolledtext, _messagebox
+    return True
+
+
+# Initial preview mode guess: HTML markers and Markdown line starts, looked
+# for in the first few KB only
+_HTML_SNIFF_RE = re.compile(r"<(?:html|body|p|div)|</", re.IGNORECASE)
+_SNIFF_CHARS = 4096
+
+# Closes the browser preview document opened by the per-style prefix
+_PREVIEW_HTML_SUFFIX = """
+  </body>
+</html>
+"""
+
+
+class _TextExtractor(HTMLParser):
+    """Collect the text nodes of an HTML document, skipping script and style.
+
+    Text is split into nodes at every tag, comment or declaration, and
+    whitespace-only nodes outside <pre>/<textarea> collapse to a newline,
+    so joining the nodes with newlines reads like BeautifulSoup's
+    newline-separated get_text() without building a tree.
+    """
+
+    _VOID = frozenset((
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    ))
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._nodes = []
+        self._run = []
+        # Open elements; an end tag closes everything opened after its match
+        self._open = []
+
+    def _end_node(self):
+        if not self._run:
+            return
+        text = "".join(self._run)
+        self._run = []
+        if "script" in self._open or "style" in self._open:
+            return
+        if "\n" in text and not text.strip() and "pre" not in self._open and "textarea" not in self._open:
+            text = "\n"
+        self._nodes.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._end_node()
+        if tag not in self._VOID:
+            self._open.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._end_node()
+
+    def handle_endtag(self, tag):
+        self._end_node()
+        for i in range(len(self._open) - 1, -1, -1):
+            if self._open[i] == tag:
+                del self._open[i:]
+                break
+
+    def handle_data(self, data):
+        self._run.append(data)
+
+    def handle_comment(self, data):
+        self._end_node()
+
+    def handle_decl(self, decl):
+        self._end_node()
+
+    def handle_pi(self, data):
+        self._end_node()
+
+    def unknown_decl(self, data):
+        self._end_node()
+        if data.startswith("CDATA["):
+            self._nodes.append(data[len("CDATA["):])
+
+    def text(self, separator: str = "\n") -> str:
+        self.close()
+        self._end_node()
+        return separator.join(self._nodes)
+
+
+def _html_to_text(html_content: str) -> str:
+    """Return the readable text of an HTML document, one node per line."""
+    extractor = _TextExtractor()
+    extractor.feed(html_content)
+    return extractor.text().strip()
+
 
 class PreConversionEditor:
     """Window for editing content before converting to ePub"""
 
+    # Rendered previews kept per (kind, mode, style, content); toggling the
+    # interpretation mode back and forth then costs a dict lookup
+    PREVIEW_CACHE_SIZE = 8
+    # Quiet period (ms) that coalesces mode toggles and keystrokes into one render
+    PREVIEW_REFRESH_DELAY_MS = 200
+
+    # Window icon shared across editors; b"" once the PNG is known to be missing
+    _icon_data: Optional[bytes] = None
+    _icon_photo = None
+    # markdown-it-py renderer for the Markdown preview; False when unavailable
+    _markdown_it: Any = None
+
     def __init__(self, content: str, metadata: Optional[Dict[str, Any]] = None,
                  on_convert: Optional[Callable] = None,
                  on_cancel: Optional[Callable] = None):
@@ -33,11 +155,21 @@ class PreConversionEditor:
             on_convert: Callback when user clicks Convert (receives edited content and metadata)
             on_cancel: Callback when user cancels
         """
+        if not tk_available():
+            raise RuntimeError("Tkinter is not available")
         self.content = content
         self.metadata = metadata or {}
         self.on_convert = on_convert
         self.on_cancel = on_cancel
         self.preview_file = None
+        self._preview_cache: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+        self._css_cache: Dict[str, str] = {}
+        self._html_prefix_cache: Dict[str, str] = {}
+        # Set by <<Modified>>; while clear, self.content is the editor text
+        self._editor_dirty = True
+        self._refresh_after_id: Optional[str] = None
+        # Refreshes while the Preview tab is hidden only mark it stale
+        self._preview_dirty = True
 
         # Create main window
         self.window = tk.Tk()
@@ -62,11 +194,11 @@ class PreConversionEditor:
                 except tk.TclError:
                     # Use default theme
                     pass
-            icon_png = (Path(__file__).resolve().parent.parent / "resources" / "icon_64.png")
-            if icon_png.exists():
-                self.window.iconphoto(True, tk.PhotoImage(file=str(icon_png)))
+            icon = self._get_icon_photo()
+            if icon is not None:
+                self.window.iconphoto(True, icon)
         except (tk.TclError, OSError) as e:
-            logger.debug(f"Could not set theme or icon: {e}")
+            logger.debug("Could not set theme or icon: %s", e)
 
         self.setup_ui()
         self.load_content()
@@ -135,6 +267,25 @@ class PreConversionEditor:
         self.style_entry = ttk.Entry(metadata_frame, textvariable=self.style_var, width=20)
         self.style_entry.grid(row=1, column=3, sticky=(tk.W, tk.E))
 
+    def _get_icon_photo(self):
+        """Return the window icon, decoding the PNG once per Tk interpreter"""
+        cls = type(self)
+        photo = cls._icon_photo
+        # A PhotoImage belongs to the interpreter that created it; every editor
+        # opens its own Tk root, so only the PNG bytes outlive a window
+        if photo is not None and photo.tk is self.window.tk:
+            return photo
+        if cls._icon_data is None:
+            icon_png = Path(__file__).resolve().parent.parent / "resources" / "icon_64.png"
+            try:
+                cls._icon_data = icon_png.read_bytes()
+            except OSError:
+                cls._icon_data = b""
+        if not cls._icon_data:
+            return None
+        cls._icon_photo = tk.PhotoImage(master=self.window, data=cls._icon_data)
+        return cls._icon_photo
+
     def setup_editor_tab(self):
         """Set up the content editor tab"""
         editor_frame = ttk.Frame(self.notebook, padding="10")
@@ -146,13 +297,21 @@ class PreConversionEditor:
         editor_frame.grid_rowconfigure(0, weight=1)
         editor_frame.grid_columnconfigure(0, weight=1)
 
-        # Load initial content
+        # Load initial content without recording it as an undoable edit
+        self.editor.configure(undo=False, autoseparators=False)
         self.editor.insert("1.0", self.content)
+        self.editor.edit_reset()
+        self.editor.configure(undo=True, autoseparators=True)
+        # Clear the flag the insert set so the first real edit fires <<Modified>>
+        self.editor.edit_modified(False)
+        self.editor.bind("<<Modified>>", self._on_editor_modified)
 
     def setup_preview_tab(self):
         """Set up the preview tab"""
         preview_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(preview_frame, text="Preview")
+        self._preview_frame = preview_frame
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.preview_text = scrolledtext.ScrolledText(preview_frame, wrap=tk.WORD, height=20, state=tk.DISABLED)
         self.preview_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -171,21 +330,21 @@ class PreConversionEditor:
             text="Text",
             value="text",
             variable=self.preview_mode_var,
-            command=self.refresh_preview,
+            command=self._schedule_refresh,
         ).grid(row=0, column=1, padx=(0, 5))
         ttk.Radiobutton(
             btn_frame,
             text="Markdown",
             value="markdown",
             variable=self.preview_mode_var,
-            command=self.refresh_preview,
+            command=self._schedule_refresh,
         ).grid(row=0, column=2, padx=(0, 5))
         ttk.Radiobutton(
             btn_frame,
             text="HTML",
             value="html",
             variable=self.preview_mode_var,
-            command=self.refresh_preview,
+            command=self._schedule_refresh,
         ).grid(row=0, column=3, padx=(0, 15))
 
         ttk.Button(btn_frame, text="Refresh Preview", command=self.refresh_preview).grid(row=0, column=4, padx=(0, 10))
@@ -210,17 +369,83 @@ class PreConversionEditor:
         """Load content into editor and preview"""
         self.refresh_preview()
 
+    def _on_editor_modified(self, event=None):
+        """Note that the editor text changed since it was last read"""
+        try:
+            # Clearing the flag below fires <<Modified>> again; ignore that one
+            if not self.editor.edit_modified():
+                return
+            # Re-arm the flag so the next edit fires <<Modified>> again
+            self.editor.edit_modified(False)
+        except tk.TclError:
+            pass
+        self._editor_dirty = True
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Refresh the preview once no further request arrives for a short while"""
+        if self._refresh_after_id is not None:
+            self.window.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.window.after(self.PREVIEW_REFRESH_DELAY_MS, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run a refresh queued by _schedule_refresh"""
+        self._refresh_after_id = None
+        self.refresh_preview()
+
+    def _current_content(self) -> str:
+        """Return the editor text, reading the widget only after edits"""
+        if self._editor_dirty:
+            try:
+                self.content = self.editor.get("1.0", tk.END).rstrip()
+                self._editor_dirty = False
+            except Exception:
+                pass
+        return self.content
+
+    def _cached_render(self, kind: str, content: str, mode: str) -> str:
+        """Return the 'text', 'body' or 'html' preview, rendering it only on a cache miss"""
+        # Only the full HTML document embeds the stylesheet
+        style = self._get_style_name() if kind == "html" else ""
+        key = (kind, mode, style, content)
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            self._preview_cache.move_to_end(key)
+            return cached
+        if kind == "html":
+            rendered = self._render_preview_html(content, mode)
+        elif kind == "body":
+            rendered = self._render_body_inner(content, mode)
+        else:
+            rendered = self._render_preview_text(content, mode)
+        self._preview_cache[key] = rendered
+        if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        return rendered
+
+    def _preview_visible(self) -> bool:
+        """Return True when the Preview tab is the selected notebook tab"""
+        try:
+            return self.notebook.select() == str(self._preview_frame)
+        except tk.TclError:
+            return True
+
+    def _on_tab_changed(self, event=None):
+        """Render a stale preview when its tab is brought to the front"""
+        if self._preview_dirty and self._preview_visible():
+            self.refresh_preview()
+
     def refresh_preview(self):
         """Refresh the preview content"""
+        if not self._preview_visible():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
         # Always use the latest content from the editor
-        try:
-            edited_content = self.editor.get("1.0", tk.END).rstrip()
-        except Exception:
-            edited_content = self.content
-        self.content = edited_content
+        edited_content = self._current_content()
 
         mode = self._get_preview_mode()
-        preview_text = self._render_preview_text(edited_content, mode)
+        preview_text = self._cached_render("text", edited_content, mode)
 
         self.preview_text.config(state=tk.NORMAL)
         self.preview_text.delete("1.0", tk.END)
@@ -230,16 +455,26 @@ class PreConversionEditor:
     def open_preview_in_browser(self):
         """Open a temporary HTML file with the preview content in the default browser"""
         try:
-            try:
-                edited_content = self.editor.get("1.0", tk.END).rstrip()
-            except Exception:
-                edited_content = self.content
-            self.content = edited_content
+            edited_content = self._current_content()
             mode = self._get_preview_mode()
-            html_content = self._render_preview_html(edited_content, mode)
-            with tempfile.NamedTemporaryFile('w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(html_content)
-                self.preview_file = f.name
+            html_content = self._cached_render("html", edited_content, mode)
+            import tempfile
+            import webbrowser
+
+            data = memoryview(html_content.encode('utf-8'))
+            fd, path = tempfile.mkstemp(suffix='.html')
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            # Only the latest preview is kept around
+            if self.preview_file:
+                try:
+                    os.unlink(self.preview_file)
+                except OSError:
+                    pass
+            self.preview_file = path
             webbrowser.open(f"file://{self.preview_file}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not open preview in browser: {e}")
@@ -261,7 +496,7 @@ class PreConversionEditor:
     def on_convert_click(self):
         """Handle Convert button click"""
         try:
-            edited_content = self.editor.get("1.0", tk.END).strip()
+            edited_content = self._current_content().strip()
             self.content = edited_content
             # Update metadata from UI
             self.metadata['title'] = self.title_var.get()
@@ -290,15 +525,13 @@ class PreConversionEditor:
     def _guess_initial_preview_mode(self) -> str:
         """Heuristic to choose an initial preview mode based on the content text."""
         text = (self.content or "").lstrip()
-        lowered = text.lower()
 
         # Basic HTML heuristic
-        if "<html" in lowered or "<body" in lowered or "<p" in lowered or "<div" in lowered or "</" in text:
+        if _HTML_SNIFF_RE.search(text, 0, _SNIFF_CHARS):
             return "html"
 
-        # Simple Markdown signals in the first lines
-        lines = text.splitlines()
-        head = lines[:20]
+        # Simple Markdown signals in the first lines (of the first few KB)
+        head = text[:_SNIFF_CHARS].splitlines()[:20]
         for line in head:
             stripped = line.lstrip()
             if stripped.startswith(("# ", "## ", "### ", "- ", "* ", "1. ")):
@@ -316,19 +549,31 @@ class PreConversionEditor:
             return "text"
         return mode
 
+    def _get_style_name(self) -> str:
+        """Return the selected CSS template name, 'default' when unset."""
+        try:
+            return (self.style_var.get() or "default").strip() or "default"
+        except Exception:
+            return "default"
+
     def _get_preview_css(self) -> str:
         """Return CSS for preview, preferring templates when available."""
-        # Prefer CSS templates from packaged content_processor if available
+        style_name = self._get_style_name()
+        css = self._css_cache.get(style_name)
+        if css is None:
+            css = self._css_cache[style_name] = self._load_preview_css(style_name)
+        return css
+
+    @staticmethod
+    def _load_preview_css(style_name: str) -> str:
+        """Resolve the CSS for a style name (uncached)."""
+        # Prefer CSS templates from packaged content_processor if available.
+        # Imported here rather than at module level: content_processor pulls in
+        # bs4 and lxml, and results are cached per style by _get_preview_css
         try:
             from .content_processor import CSSTemplates  # type: ignore
 
-            try:
-                style_name = (self.style_var.get() or "default").strip() or "default"
-            except Exception:
-                style_name = "default"
-
-            templates = CSSTemplates()
-            css = templates.get_template(style_name)
+            css = CSSTemplates().get_template(style_name)
             if css:
                 return css
         except Exception:
@@ -342,16 +587,54 @@ class PreConversionEditor:
         h1, h2, h3, h4 { margin-top: 1.2em; }
         """
 
+    def _preview_html_prefix(self) -> str:
+        """Return the document markup up to the body content for the current style."""
+        style_name = self._get_style_name()
+        prefix = self._html_prefix_cache.get(style_name)
+        if prefix is None:
+            css = self._get_preview_css()
+            prefix = self._html_prefix_cache[style_name] = f"""<!DOCTYPE html>
+<html>
+  <head>
+    <meta charset="utf-8"/>
+    <style>
+{css}
+    </style>
+  </head>
+  <body>
+"""
+        return prefix
+
     def _render_preview_html(self, content: str, mode: str) -> str:
         """Build an HTML document for the current preview mode."""
-        css = self._get_preview_css()
+        body_inner = self._cached_render("body", content, mode)
+        return self._preview_html_prefix() + body_inner + _PREVIEW_HTML_SUFFIX
+
+    @classmethod
+    def _get_markdown_it(cls):
+        """Return the shared MarkdownIt renderer, or False when it is not installed"""
+        if cls._markdown_it is None:
+            # Optional and much faster than markdown2; build its tables once
+            try:
+                from markdown_it import MarkdownIt  # type: ignore
+
+                cls._markdown_it = MarkdownIt("commonmark")
+            except Exception:
+                cls._markdown_it = False
+        return cls._markdown_it
 
+    def _render_body_inner(self, content: str, mode: str) -> str:
+        """Render the <body> markup for the current preview mode."""
         body_inner = ""
         if mode == "markdown":
+            md = self._get_markdown_it()
             try:
-                import markdown2  # type: ignore
+                if md:
+                    body_inner = md.render(content or "")
+                else:
+                    import markdown2  # type: ignore
 
-                body_inner = markdown2.markdown(content or "")
+                    body_inner = markdown2.markdown(content or "")
             except Exception:
                 body_inner = f"<pre>{html.escape(content or '')}</pre>"
         elif mode == "html":
@@ -369,34 +652,18 @@ class PreConversionEditor:
             body_inner = cleaned or ""
         else:
             body_inner = f"<pre>{html.escape(content or '')}</pre>"
-
-        return f"""<!DOCTYPE html>
-<html>
-  <head>
-    <meta charset="utf-8"/>
-    <style>
-{css}
-    </style>
-  </head>
-  <body>
-{body_inner}
-  </body>
-</html>
-"""
+        return body_inner
 
     def _render_preview_text(self, content: str, mode: str) -> str:
         """Render preview text for the in-window widget."""
         if mode == "text":
             return content
 
-        # For Markdown/HTML, render to HTML and then strip tags to get a readable text preview
+        # For Markdown/HTML, render the body markup (no CSS or document
+        # wrapper needed) and then strip tags to get a readable text preview
         try:
-            html_content = self._render_preview_html(content, mode)
-            from bs4 import BeautifulSoup  # type: ignore
-
-            soup = BeautifulSoup(html_content, "html.parser")
+            body_inner = self._cached_render("body", content, mode)
             # Use newlines to preserve basic structure (headings, paragraphs)
-            text = soup.get_text("\n")
-            return text.strip()
+            return _html_to_text(body_inner)
         except Exception:
             return content
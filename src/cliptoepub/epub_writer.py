@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+ePub writing helpers for Clipboard to ePub
+
+XHTML page templates, a lazily rendered chapter item and a faster archive
+writer on top of ebooklib. Kept out of converter so that importing the
+converter does not pull in ebooklib/lxml until a book is actually built.
+"""
+
+from __future__ import annotations
+
+import functools
+import html
+import io
+import os
+import re
+import zipfile
+from typing import Any
+
+import ebooklib
+from ebooklib import epub
+
+
+# Deflate level (0-9) for written ePubs. Clipboard payloads are small text
+# that compresses nearly as well at level 1 as at zlib's default 6, at a
+# fraction of the CPU cost. Override with CLIPTOEPUB_EPUB_COMPRESS_LEVEL.
+EPUB_COMPRESS_LEVEL = min(9, max(0, int(os.environ.get("CLIPTOEPUB_EPUB_COMPRESS_LEVEL", "1"))))
+
+# Item types whose payloads are already compressed; deflating them again
+# costs CPU for no size benefit.
+_STORED_ITEM_TYPES = frozenset({ebooklib.ITEM_IMAGE, ebooklib.ITEM_FONT, ebooklib.ITEM_VIDEO, ebooklib.ITEM_AUDIO})
+
+
+class EpubWriter(epub.EpubWriter):
+    """EpubWriter that deflates text at EPUB_COMPRESS_LEVEL and stores media as-is."""
+
+    def write(self):
+        self.out = zipfile.ZipFile(self.file_name, "w", zipfile.ZIP_DEFLATED, compresslevel=EPUB_COMPRESS_LEVEL)
+        self.out.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+
+        self._write_container()
+        self._write_opf()
+        self._write_items()
+
+        self.out.close()
+
+    def _write_items(self):
+        folder = self.book.FOLDER_NAME
+        for item in self.book.get_items():
+            if isinstance(item, epub.EpubNcx):
+                self.out.writestr(f"{folder}/{item.file_name}", self._get_ncx())
+            elif isinstance(item, epub.EpubNav):
+                self.out.writestr(f"{folder}/{item.file_name}", self._get_nav(item))
+            else:
+                name = f"{folder}/{item.file_name}" if item.manifest else item.file_name
+                compress_type = zipfile.ZIP_STORED if item.get_type() in _STORED_ITEM_TYPES else None
+                self.out.writestr(name, item.get_content(), compress_type=compress_type)
+
+
+def epub_bytes(book: epub.EpubBook) -> bytes:
+    """Return the archive for ``book`` as bytes, for callers that do their own I/O."""
+    buf = io.BytesIO()
+    # Chapters never carry epub:type="pagebreak" markers, so skip the page-list
+    # scan that re-parses every chapter body while writing the nav document.
+    writer = EpubWriter(buf, book, {"epub3_pages": False})
+    writer.process()
+    writer.write()
+    return buf.getvalue()
+
+
+# Static XHTML scaffold shared by chapter and TOC documents, pre-encoded so
+# the per-page work is a single bytes join around the title and body.
+_XHTML_PRE = (
+    b'<html xmlns="http://www.w3.org/1999/xhtml">\n<head>\n'
+    b'    <meta charset="UTF-8"/>\n    <title>'
+)
+_XHTML_HEAD_END = (
+    b'</title>\n    <link rel="stylesheet" type="text/css" href="style.css"/>\n'
+    b'</head>\n<body>\n    '
+)
+_XHTML_END = b"\n</body>\n</html>"
+_H1_OPEN = b"<h1>"
+_H1_CLOSE = b"</h1>\n    "
+
+
+# html.parser only exposes soup.body when the markup has a <body> tag, so
+# fragments (the usual chapter payload) can skip the parse entirely.
+_BODY_TAG_RE = re.compile(r"<body[\s>/]", re.IGNORECASE)
+
+
+def body_inner(content: str) -> str:
+    """Return the <body> contents of ``content`` when it is a full document."""
+    txt = (content or "").strip()
+    if "\x00" in txt:
+        txt = txt.replace("\x00", "")
+    if not _BODY_TAG_RE.search(txt):
+        return txt
+    inner = txt
+    try:
+        from bs4 import BeautifulSoup  # type: ignore
+        soup = BeautifulSoup(txt, 'html.parser')
+        if soup.body:
+            inner = soup.body.decode_contents() or inner
+    except Exception:
+        pass
+    return inner
+
+
+def xhtml_page(doc_title: str, body: str, *, heading: bool = True) -> bytes:
+    """Wrap ``body`` as an XHTML page; the title is escaped for text content.
+
+    Title and body are each UTF-8 encoded exactly once and joined with the
+    pre-encoded scaffold in a single allocation; ebooklib receives the bytes
+    as-is, with no further str round trip.
+    """
+    title_b = html.escape(doc_title, quote=False).encode("utf-8", errors="ignore")
+    body_b = body.encode("utf-8", errors="ignore")
+    if heading:
+        return b"".join((_XHTML_PRE, title_b, _XHTML_HEAD_END, _H1_OPEN, title_b, _H1_CLOSE, body_b, _XHTML_END))
+    return b"".join((_XHTML_PRE, title_b, _XHTML_HEAD_END, body_b, _XHTML_END))
+
+
+def chapter_xhtml(doc_title: str, content: str) -> bytes:
+    """Wrap chapter content safely as XHTML bytes."""
+    return xhtml_page(doc_title, body_inner(content))
+
+
+class LazyChapter(epub.EpubHtml):
+    """EpubHtml that renders its XHTML only when the writer reads it.
+
+    Only the source text is held on the book; each chapter's wrapped document
+    exists just long enough to be written into the archive, so peak memory no
+    longer includes a rendered copy of every chapter.
+    """
+
+    def __init__(self, source: str, **kwargs: Any) -> None:
+        self._source = source
+        super().__init__(**kwargs)
+
+    @property
+    def content(self) -> bytes:  # type: ignore[override]
+        return chapter_xhtml(self.title, self._source)
+
+    @content.setter
+    def content(self, value: Any) -> None:
+        # EpubItem.__init__ assigns content; the source text is authoritative
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def style_item(css: str) -> epub.EpubItem:
+    """Return a shared stylesheet item for the given CSS text.
+
+    Plain EpubItems are serialized from their content on every write, so one
+    instance can be added to any number of books. Keyed on the str (whose hash
+    is cached on the object) so a repeat conversion neither re-encodes nor
+    re-hashes the stylesheet.
+    """
+    content = css.encode("utf-8", errors="ignore")
+    return epub.EpubItem(uid="style", file_name="style.css", media_type="text/css", content=content)
+
+
+__all__ = [
+    "EPUB_COMPRESS_LEVEL",
+    "EpubWriter",
+    "LazyChapter",
+    "body_inner",
+    "chapter_xhtml",
+    "epub_bytes",
+    "style_item",
+    "xhtml_page",
+]
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import inspect
+import sys
+import weakref
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Protocol
 
+# __slots__ dataclasses need Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class ErrorEvent:
     title: str
     message: str
@@ -17,6 +23,34 @@ class ErrorCallback(Protocol):
     def __call__(self, event: ErrorEvent | str) -> None: ...
 
 
+# Callback -> "event" or "str", decided once per callback from its signature
+_cb_kind_cache: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def _callback_kind(cb: Any) -> Optional[str]:
+    """Return "str" for old-style message callbacks, "event" otherwise.
+
+    Returns None when the signature cannot be inspected.
+    """
+    try:
+        return _cb_kind_cache[cb]
+    except (KeyError, TypeError):
+        pass
+    try:
+        params = list(inspect.signature(cb).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    kind = "event"
+    if len(params) == 1 and (params[0].annotation in (str, "str") or params[0].name == "message"):
+        kind = "str"
+    try:
+        _cb_kind_cache[cb] = kind
+    except TypeError:
+        # Not weak-referenceable; the signature is inspected again next time
+        pass
+    return kind
+
+
 def notify_error(cb: Optional[ErrorCallback], title: str, message: str, *, severity: str = "error", context: Optional[Dict[str, Any]] = None) -> None:
     """Invoke an error callback in a backward-compatible way.
 
@@ -25,7 +59,17 @@ def notify_error(cb: Optional[ErrorCallback], title: str, message: str, *, sever
     """
     if not cb:
         return
+    kind = _callback_kind(cb)
+    if kind == "str":
+        try:
+            cb(f"{title}: {message}")
+        except Exception:
+            pass
+        return
     event = ErrorEvent(title=title, message=message, severity=severity, context=context)
+    if kind == "event":
+        cb(event)
+        return
     try:
         cb(event)
     except TypeError:
@@ -4,7 +4,9 @@ History Manager for Clipboard to ePub
 Manages conversion history and multi-clip combining functionality
 """
 
+import atexit
 import json
+import os
 import logging
 import hashlib
 from pathlib import Path
@@ -12,21 +14,39 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from collections import deque
 import threading
+import weakref
 from . import paths as paths
 
 logger = logging.getLogger('HistoryManager')
 
+# Objects with writes deferred to flush(). One exit hook covers them all, and
+# the weak set lets instances dropped by a converter restart be collected
+_pending_flush: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _flush_pending() -> None:
+    for obj in list(_pending_flush):
+        try:
+            obj.flush()
+        except Exception as e:
+            logger.error("Error flushing %s at exit: %s", type(obj).__name__, e)
+
+
+atexit.register(_flush_pending)
+
 
 class ConversionHistory:
     """Manages history of ePub conversions"""
 
-    def __init__(self, history_file: Optional[Path] = None, max_entries: int = 100):
+    def __init__(self, history_file: Optional[Path] = None, max_entries: int = 100, save_every: int = 1):
         """
         Initialize conversion history
 
         Args:
             history_file: Path to history JSON file
             max_entries: Maximum number of history entries to keep
+            save_every: Rewrite the history file after this many new entries;
+                pending entries are also written by flush() and at exit
         """
         if history_file is None:
             history_file = paths.get_history_path()
@@ -35,9 +55,13 @@ class ConversionHistory:
         self.max_entries = max_entries
         self.history = deque(maxlen=max_entries)
         self.lock = threading.Lock()
+        self.save_every = max(1, int(save_every))
+        self._unsaved = 0
 
         self.ensure_history_dir()
         self.load_history()
+        if self.save_every > 1:
+            _pending_flush.add(self)
 
     def ensure_history_dir(self):
         """Create history directory if it doesn't exist"""
@@ -50,9 +74,9 @@ class ConversionHistory:
                 with open(self.history_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.history = deque(data, maxlen=self.max_entries)
-                logger.info(f"Loaded {len(self.history)} history entries")
+                logger.info("Loaded %s history entries", len(self.history))
         except Exception as e:
-            logger.error(f"Error loading history: {e}")
+            logger.error("Error loading history: %s", e)
             self.history = deque(maxlen=self.max_entries)
 
     def save_history(self):
@@ -61,9 +85,10 @@ class ConversionHistory:
             with self.lock:
                 with open(self.history_file, 'w', encoding='utf-8') as f:
                     json.dump(list(self.history), f, indent=2, ensure_ascii=False)
+                self._unsaved = 0
             logger.debug("History saved")
         except Exception as e:
-            logger.error(f"Error saving history: {e}")
+            logger.error("Error saving history: %s", e)
 
     def add_entry(self, filepath: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -76,9 +101,10 @@ class ConversionHistory:
         Returns:
             The created history entry
         """
+        now = datetime.now()
         entry = {
-            'id': self.generate_id(),
-            'timestamp': datetime.now().isoformat(),
+            'id': self.generate_id(now),
+            'timestamp': now.isoformat(),
             'filepath': str(filepath),
             'filename': Path(filepath).name,
             'title': metadata.get('title', 'Untitled'),
@@ -92,11 +118,19 @@ class ConversionHistory:
 
         with self.lock:
             self.history.appendleft(entry)
-        self.save_history()
+            self._unsaved += 1
+            due = self._unsaved >= self.save_every
+        if due:
+            self.save_history()
 
-        logger.info(f"Added to history: {entry['title']}")
+        logger.info("Added to history: %s", entry['title'])
         return entry
 
+    def flush(self):
+        """Write entries added since the last save, if any"""
+        if self._unsaved:
+            self.save_history()
+
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get recent conversion entries
@@ -167,18 +201,18 @@ class ConversionHistory:
                         new_history.append(entry)
                 except (ValueError, KeyError) as e:
                     # Keep entries with invalid timestamps
-                    logger.warning(f"Invalid timestamp in entry, keeping it: {e}")
+                    logger.warning("Invalid timestamp in entry, keeping it: %s", e)
                     new_history.append(entry)
 
             self.history = new_history
         self.save_history()
 
-        logger.info(f"Cleared entries older than {days} days")
+        logger.info("Cleared entries older than %s days", days)
 
     @staticmethod
-    def generate_id() -> str:
+    def generate_id(now: Optional[datetime] = None) -> str:
         """Generate unique ID for history entry"""
-        return datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:20]
+        return (now or datetime.now()).strftime("%Y%m%d_%H%M%S_%f")[:20]
 
 
 class ClipboardAccumulator:
@@ -192,6 +226,11 @@ class ClipboardAccumulator:
             max_clips: Maximum number of clips to accumulate
         """
         self.clips = []
+        # Parallel to self.clips: the "[Clipped at ...]" header of each clip,
+        # rendered once on add so combine_clips only has to join strings
+        self._headers: List[str] = []
+        # content_hash -> clip, so a re-pressed accumulate hotkey is an O(1) no-op
+        self._by_hash: Dict[str, Dict[str, Any]] = {}
         self.max_clips = max_clips
         self.lock = threading.Lock()
 
@@ -206,11 +245,13 @@ class ClipboardAccumulator:
         Returns:
             The clip entry
         """
+        content_hash = hashlib.md5(content.encode()).hexdigest()
+        now = datetime.now()
         clip = {
             'id': self.generate_clip_id(),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'content': content,
-            'content_hash': hashlib.md5(content.encode()).hexdigest(),
+            'content_hash': content_hash,
             'length': len(content),
             'metadata': metadata or {},
             'preview': content[:200] + '...' if len(content) > 200 else content
@@ -218,18 +259,23 @@ class ClipboardAccumulator:
 
         with self.lock:
             # Check for duplicates
-            for existing in self.clips:
-                if existing['content_hash'] == clip['content_hash']:
-                    logger.info("Duplicate clip ignored")
-                    return existing
+            existing = self._by_hash.get(content_hash)
+            if existing is not None:
+                logger.info("Duplicate clip ignored")
+                return existing
 
             self.clips.append(clip)
+            self._by_hash[content_hash] = clip
+            self._headers.append(f"[Clipped at {now.strftime('%Y-%m-%d %H:%M:%S')}]\n\n")
 
             # Limit number of clips
             if len(self.clips) > self.max_clips:
+                for dropped in self.clips[:-self.max_clips]:
+                    self._by_hash.pop(dropped['content_hash'], None)
                 self.clips = self.clips[-self.max_clips:]
+                self._headers = self._headers[-self.max_clips:]
 
-        logger.info(f"Added clip to accumulator ({len(self.clips)} total)")
+        logger.info("Added clip to accumulator (%s total)", len(self.clips))
         return clip
 
     def get_clips(self) -> List[Dict[str, Any]]:
@@ -246,6 +292,8 @@ class ClipboardAccumulator:
         """Clear all accumulated clips"""
         with self.lock:
             self.clips.clear()
+            self._headers.clear()
+            self._by_hash.clear()
         logger.info("Accumulator cleared")
 
     def remove_clip(self, clip_id: str) -> bool:
@@ -262,7 +310,9 @@ class ClipboardAccumulator:
             for i, clip in enumerate(self.clips):
                 if clip['id'] == clip_id:
                     del self.clips[i]
-                    logger.info(f"Removed clip {clip_id}")
+                    del self._headers[i]
+                    self._by_hash.pop(clip['content_hash'], None)
+                    logger.info("Removed clip %s", clip_id)
                     return True
         return False
 
@@ -280,14 +330,14 @@ class ClipboardAccumulator:
             if not self.clips:
                 return ""
 
-            contents = []
-            for clip in self.clips:
-                # Add timestamp header
-                timestamp = datetime.fromisoformat(clip['timestamp']).strftime("%Y-%m-%d %H:%M:%S")
-                header = f"[Clipped at {timestamp}]"
-                contents.append(header + "\n\n" + clip['content'])
+            # Header, body and separator go into one flat list so each clip's
+            # content is copied exactly once, by the final join
+            pieces = []
+            for header, clip in zip(self._headers, self.clips):
+                pieces += (header, clip['content'], separator)
+            pieces.pop()
 
-            return separator.join(contents)
+            return ''.join(pieces)
 
     def get_combined_metadata(self) -> Dict[str, Any]:
         """
@@ -339,9 +389,13 @@ class ConversionCache:
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.cache_index = {}
         self.lock = threading.Lock()
+        # Cache hits only touch last_accessed; the index is written on the
+        # next put/cleanup or by flush() instead of once per hit
+        self._index_dirty = False
 
         self.ensure_cache_dir()
         self.load_index()
+        _pending_flush.add(self)
 
     def ensure_cache_dir(self):
         """Create cache directory if it doesn't exist"""
@@ -354,9 +408,9 @@ class ConversionCache:
             if index_file.exists():
                 with open(index_file, 'r') as f:
                     self.cache_index = json.load(f)
-                logger.info(f"Loaded cache index with {len(self.cache_index)} entries")
+                logger.info("Loaded cache index with %s entries", len(self.cache_index))
         except Exception as e:
-            logger.error(f"Error loading cache index: {e}")
+            logger.error("Error loading cache index: %s", e)
             self.cache_index = {}
 
     def save_index(self):
@@ -365,8 +419,15 @@ class ConversionCache:
         try:
             with open(index_file, 'w') as f:
                 json.dump(self.cache_index, f, indent=2)
+            self._index_dirty = False
         except Exception as e:
-            logger.error(f"Error saving cache index: {e}")
+            logger.error("Error saving cache index: %s", e)
+
+    def flush(self):
+        """Write the index if cache hits have updated it since the last save"""
+        with self.lock:
+            if self._index_dirty:
+                self.save_index()
 
     def get_cache_key(self, content: str, options: Dict[str, Any]) -> str:
         """
@@ -379,12 +440,11 @@ class ConversionCache:
         Returns:
             Cache key
         """
-        # Create a hash of content and options
-        cache_data = {
-            'content_hash': hashlib.md5(content.encode()).hexdigest(),
-            'options': json.dumps(options, sort_keys=True)
-        }
-        return hashlib.md5(json.dumps(cache_data).encode()).hexdigest()
+        # One streaming hash over content and options (same key length as MD5)
+        h = hashlib.blake2b(content.encode(), digest_size=16)
+        h.update(b'\0')
+        h.update(json.dumps(options, sort_keys=True).encode())
+        return h.hexdigest()
 
     def get(self, content: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -409,12 +469,13 @@ class ConversionCache:
                         logger.info("Cache hit")
                         # Update last accessed time
                         self.cache_index[cache_key]['last_accessed'] = datetime.now().isoformat()
-                        self.save_index()
+                        self._index_dirty = True
                         return data
                     except (json.JSONDecodeError, OSError, IOError) as e:
-                        logger.error(f"Error reading cache file {cache_file}: {e}")
+                        logger.error("Error reading cache file %s: %s", cache_file, e)
                         # Remove corrupted cache entry
                         self.cache_index.pop(cache_key, None)
+                        self._index_dirty = True
 
         return None
 
@@ -434,22 +495,24 @@ class ConversionCache:
             with self.lock:
                 # Save result to file
                 with open(cache_file, 'w') as f:
-                    json.dump(result, f, indent=2)
+                    json.dump(result, f, separators=(',', ':'))
 
                 # Update index
+                stamp = datetime.now().isoformat()
+                size = os.path.getsize(cache_file)
                 self.cache_index[cache_key] = {
-                    'created': datetime.now().isoformat(),
-                    'last_accessed': datetime.now().isoformat(),
-                    'size': cache_file.stat().st_size
+                    'created': stamp,
+                    'last_accessed': stamp,
+                    'size': size
                 }
 
                 self.save_index()
                 self.cleanup_if_needed()
 
-            logger.info(f"Cached result ({cache_file.stat().st_size / 1024:.1f} KB)")
+            logger.info("Cached result (%.1f KB)", size / 1024)
 
         except Exception as e:
-            logger.error(f"Error caching result: {e}")
+            logger.error("Error caching result: %s", e)
 
     def cleanup_if_needed(self):
         """Clean up old cache entries if size limit exceeded"""
@@ -474,9 +537,9 @@ class ConversionCache:
                     cache_file.unlink()
                     total_size -= entry['size']
                     del self.cache_index[cache_key]
-                    logger.debug(f"Removed cache entry {cache_key}")
+                    logger.debug("Removed cache entry %s", cache_key)
                 except (OSError, IOError) as e:
-                    logger.warning(f"Could not remove cache file {cache_key}: {e}")
+                    logger.warning("Could not remove cache file %s: %s", cache_key, e)
 
             self.save_index()
 
@@ -488,7 +551,7 @@ class ConversionCache:
                 try:
                     cache_file.unlink()
                 except (OSError, IOError) as e:
-                    logger.warning(f"Could not remove cache file {cache_key}: {e}")
+                    logger.warning("Could not remove cache file %s: %s", cache_key, e)
 
             self.cache_index.clear()
             self.save_index()
@@ -4,20 +4,70 @@ from __future__ import annotations
 """
 Hotkey parsing helpers shared by menubar and tray apps.
 
-Converts strings like "cmd+shift+e" or "ctrl+alt+f2" into pynput key sets.
+Converts strings like "cmd+shift+e" or "ctrl+alt+f2" into pynput key sets,
+and matches key events against such a combo.
 """
 
-from typing import Optional, Set
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Optional, Set, Tuple
 
+# Hotkey tokens that name special keys, mapped to pynput.keyboard.Key members
+_KEY_ALIASES = {
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "cmd": "cmd",
+    "command": "cmd",
+    "meta": "cmd",
+    "alt": "alt",
+    "option": "alt",
+    "shift": "shift",
+    "space": "space",
+    "tab": "tab",
+    "enter": "enter",
+    "return": "enter",
+    "backspace": "backspace",
+    "esc": "esc",
+    "escape": "esc",
+}
 
-def parse_hotkey_string(text: Optional[str]):
-    """Convert a hotkey like 'ctrl+shift+e' into a pynput combo set.
 
-    Returns a set of pynput keyboard keys, or None when input is empty/invalid.
+# pynput.keyboard (or None when pynput cannot be imported) and the token ->
+# key table built from it. Both are resolved by the first parse rather than
+# at import: converter imports this module, and importing pynput opens the
+# display/HID connection, which converter defers until it is needed.
+_UNRESOLVED: Any = object()
+_kb: Any = _UNRESOLVED
+_KEY_MAP: Dict[str, object] = {}
+
+
+def _resolve_keyboard() -> Any:
+    """Import pynput.keyboard once and build _KEY_MAP from it."""
+    global _kb, _KEY_MAP
+    if _kb is _UNRESOLVED:
+        try:
+            from pynput import keyboard as kb
+        except Exception:
+            kb = None
+        key_map: Dict[str, object] = {}
+        if kb is not None:
+            for token, name in _KEY_ALIASES.items():
+                key = getattr(kb.Key, name, None)
+                if key is not None:
+                    key_map[token] = key
+            for name, key in kb.Key.__members__.items():
+                if name.startswith("f") and name[1:].isdigit():
+                    key_map[name] = key
+        _KEY_MAP = key_map
+        _kb = kb
+    return _kb
+
+
+def parse_hotkey_string(text: Optional[str]) -> Optional[FrozenSet[object]]:
+    """Convert a hotkey like 'ctrl+shift+e' into a pynput combo.
+
+    Returns a frozenset of pynput keyboard keys, or None when input is empty/invalid.
     """
-    try:
-        from pynput import keyboard
-    except Exception:
+    kb = _kb if _kb is not _UNRESOLVED else _resolve_keyboard()
+    if kb is None:
         return None
 
     if not text:
@@ -26,29 +76,80 @@ def parse_hotkey_string(text: Optional[str]):
     parts = [p.strip().lower() for p in str(text).split('+') if p.strip()]
     combo: Set[object] = set()
     for p in parts:
-        if p in ("ctrl", "control"):
-            combo.add(keyboard.Key.ctrl)
-        elif p in ("cmd", "command", "meta"):
-            combo.add(keyboard.Key.cmd)
-        elif p in ("alt", "option"):
-            combo.add(keyboard.Key.alt)
-        elif p == "shift":
-            combo.add(keyboard.Key.shift)
+        key = _KEY_MAP.get(p)
+        if key is not None:
+            combo.add(key)
         elif len(p) == 1:
-            combo.add(keyboard.KeyCode.from_char(p))
-        elif p.startswith('f') and p[1:].isdigit():
-            try:
-                combo.add(getattr(keyboard.Key, p))
-            except AttributeError:
-                pass
-        elif p in ("space", "tab", "enter", "return", "backspace", "esc", "escape"):
-            key_name = "esc" if p == "escape" else ("enter" if p == "return" else p)
-            try:
-                combo.add(getattr(keyboard.Key, key_name))
-            except AttributeError:
-                pass
-    return combo or None
-
-
-__all__ = ["parse_hotkey_string"]
+            combo.add(kb.KeyCode.from_char(p))
+    return frozenset(combo) or None
+
+
+class MultiHotkeyMatcher:
+    """Track several combos against one shared pressed-key bitmask.
+
+    Every key used by any combo owns one bit, so a key event costs a single
+    dict lookup however many combos are registered.
+    """
+
+    def __init__(self, combos: Iterable[Iterable[Hashable]]) -> None:
+        bit_for: dict = {}
+        masks = []
+        for combo in combos:
+            mask = 0
+            for key in combo:
+                mask |= bit_for.setdefault(key, 1 << len(bit_for))
+            masks.append(mask)
+        self._bit_for = bit_for
+        self._combo_masks = tuple(masks)
+        # Keys every combo needs (typically the modifiers); until all of them
+        # are held no combo can complete, so letters typed alone exit early
+        shared = -1
+        for mask in masks:
+            if mask:
+                shared &= mask
+        self._shared_mask = max(shared, 0)
+        self._pressed_mask = 0
+
+    def press(self, key: Hashable) -> Tuple[int, ...]:
+        """Record a key press; return the indexes of the combos it completes."""
+        bit = self._bit_for.get(key)
+        if bit is None:
+            return ()
+        previous = self._pressed_mask
+        pressed = previous | bit
+        if pressed == previous:
+            return ()
+        self._pressed_mask = pressed
+        shared = self._shared_mask
+        if pressed & shared != shared:
+            return ()
+        return tuple(
+            i for i, mask in enumerate(self._combo_masks)
+            if pressed & mask == mask and previous & mask != mask
+        )
+
+    def release(self, key: Hashable) -> None:
+        bit = self._bit_for.get(key)
+        if bit is not None:
+            self._pressed_mask &= ~bit
+
+    def reset(self) -> None:
+        self._pressed_mask = 0
+
+
+class HotkeyMatcher(MultiHotkeyMatcher):
+    """Track pressed keys of one combo; a MultiHotkeyMatcher with a single combo."""
+
+    def __init__(self, combo: Iterable[Hashable]) -> None:
+        super().__init__([combo])
+
+    def press(self, key: Hashable) -> bool:  # type: ignore[override]
+        """Record a key press; return True when it completes the combo.
+
+        Auto-repeat of a key while the combo is already held does not fire again.
+        """
+        return bool(super().press(key))
+
+
+__all__ = ["HotkeyMatcher", "MultiHotkeyMatcher", "parse_hotkey_string"]
 
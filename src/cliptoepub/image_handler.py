@@ -17,6 +17,7 @@ import tempfile
 from pathlib import Path
 from typing import Optional, Dict, Tuple, Any
 
+import PIL
 from PIL import Image, ImageOps
 import pytesseract
 from datetime import datetime
@@ -48,6 +49,16 @@ class ImageHandler:
         self.enable_ocr = enable_ocr
         self.optimize_images = optimize_images
         self.image_cache = {}  # Cache for processed images
+        if logger.isEnabledFor(logging.DEBUG):
+            # Pillow-SIMD reports itself with a ".postN" version suffix; JPEG
+            # encoding is much faster when the build links libjpeg-turbo
+            from PIL import features
+            logger.debug(
+                "Using Pillow %s (libjpeg %s, turbo: %s)",
+                PIL.__version__,
+                features.version("jpg"),
+                features.check_feature("libjpeg_turbo"),
+            )
 
     def detect_image_in_clipboard(self) -> Optional[Image.Image]:
         """
@@ -76,7 +87,7 @@ class ImageHandler:
             logger.debug("Clipboard image detection is not supported on this platform")
             return None
         except Exception as e:
-            logger.debug(f"No image detected in clipboard: {e}", exc_info=True)
+            logger.debug("No image detected in clipboard: %s", e, exc_info=True)
             return None
 
     def _detect_image_via_imagegrab(self) -> Optional[Image.Image]:
@@ -87,13 +98,13 @@ class ImageHandler:
         try:
             from PIL import ImageGrab  # type: ignore
         except Exception as e:
-            logger.debug(f"ImageGrab not available for clipboard detection: {e}")
+            logger.debug("ImageGrab not available for clipboard detection: %s", e)
             return None
 
         try:
             data = ImageGrab.grabclipboard()
         except Exception as e:
-            logger.debug(f"ImageGrab.grabclipboard() failed: {e}")
+            logger.debug("ImageGrab.grabclipboard() failed: %s", e)
             return None
 
         if isinstance(data, Image.Image):
@@ -106,11 +117,9 @@ class ImageHandler:
                     suffix = Path(item).suffix.lower()
                     if suffix in self.SUPPORTED_FORMATS:
                         try:
-                            with Image.open(item) as img:
-                                img.load()
-                                return img.copy()
+                            return self._load_image_file(item)
                         except Exception as e:
-                            logger.debug(f"Failed to open image file from clipboard list '{item}': {e}")
+                            logger.debug("Failed to open image file from clipboard list '%s': %s", item, e)
 
         logger.debug("No image data found in clipboard via ImageGrab")
         return None
@@ -169,14 +178,11 @@ class ImageHandler:
             try:
                 subprocess.run([pngpaste_path, tmp_path], check=True)
                 # Fully load image into memory so temp file can be removed
-                with Image.open(tmp_path) as img:
-                    img.load()
-                    image = img.copy()
-                return image
+                return self._load_image_file(tmp_path)
             except subprocess.CalledProcessError as e:
-                logger.warning(f"pngpaste failed to read clipboard image: {e}")
+                logger.warning("pngpaste failed to read clipboard image: %s", e)
             except Exception as e:
-                logger.warning(f"Unable to open image written by pngpaste: {e}")
+                logger.warning("Unable to open image written by pngpaste: %s", e)
 
             return None
         finally:
@@ -187,6 +193,21 @@ class ImageHandler:
                 except OSError:
                     pass
 
+    @staticmethod
+    def _load_image_file(path: str) -> Image.Image:
+        """
+        Decode an image file fully into memory, without keeping the file open
+
+        Pillow may keep the file handle after load() (GIFs and other
+        multi-frame formats do), so the pixels are copied out and the file is
+        closed before returning; the source format is carried over to the copy.
+        """
+        with Image.open(path) as img:
+            img.load()
+            image = img.copy()
+            image.format = img.format
+        return image
+
     def _detect_image_windows_clipboard(self) -> Optional[Image.Image]:
         """
         Windows-specific clipboard image detection using Pillow's ImageGrab.
@@ -225,8 +246,12 @@ class ImageHandler:
                     resample_filter = getattr(Image, "LANCZOS", getattr(Image, "ANTIALIAS", Image.BICUBIC))
                 image.thumbnail((self.MAX_WIDTH, self.MAX_HEIGHT), resample_filter)
 
-            # Auto-orient based on EXIF data
-            image = ImageOps.exif_transpose(image)
+            # Auto-orient based on EXIF data; in place where supported, since
+            # exif_transpose otherwise copies the image even when upright
+            try:
+                ImageOps.exif_transpose(image, in_place=True)
+            except TypeError:  # Pillow < 9.4
+                image = ImageOps.exif_transpose(image)
 
             # Save to bytes
             output = io.BytesIO()
@@ -241,7 +266,7 @@ class ImageHandler:
             return output.getvalue(), media_type
 
         except Exception as e:
-            logger.error(f"Error optimizing image: {e}")
+            logger.error("Error optimizing image: %s", e)
             raise
 
     def extract_text_from_image(self, image: Image.Image) -> Optional[str]:
@@ -273,13 +298,13 @@ class ImageHandler:
             text = text.strip()
 
             if text:
-                logger.info(f"Extracted {len(text)} characters from image using OCR")
+                logger.info("Extracted %s characters from image using OCR", len(text))
                 return text
 
             return None
 
         except Exception as e:
-            logger.error(f"OCR failed: {e}")
+            logger.error("OCR failed: %s", e)
             return None
 
     def process_image_for_epub(self, image: Image.Image,
@@ -336,9 +361,8 @@ class ImageHandler:
         # Cache the result
         self.image_cache[image_hash] = result
 
-        logger.info(f"Processed image: {result['title']} "
-                   f"({result['metadata']['width']}x{result['metadata']['height']}, "
-                   f"{result['size'] / 1024:.1f} KB)")
+        logger.info("Processed image: %s (%sx%s, %.1f KB)", result['title'],
+                    result['metadata']['width'], result['metadata']['height'], result['size'] / 1024)
 
         return result
 
@@ -354,35 +378,37 @@ class ImageHandler:
         """
         title = image_data['title']
 
-        # Create HTML content for the image
-        content = f'''
+        # The base64 payload can be megabytes; collect the pieces and join once
+        # rather than re-copying it with every += below.
+        parts = [f'''
         <div class="image-container">
-            <img src="data:{image_data['media_type']};base64,{image_data['data']}"
+            <img src="data:{image_data['media_type']};base64,''', image_data['data'], f'''"
                  alt="{title}"
                  style="max-width: 100%; height: auto; display: block; margin: 0 auto;" />
             <p class="image-caption">{title}</p>
-        '''
+        ''']
 
         # Add OCR text if available
         if image_data.get('has_text') and image_data.get('ocr_text'):
-            content += f'''
+            parts.append(f'''
             <div class="ocr-text">
                 <h3>Extracted Text</h3>
                 <div class="ocr-content">
                     {image_data['ocr_text'].replace(chr(10), '<br/>')}
                 </div>
             </div>
-            '''
+            ''')
 
         # Add metadata
-        content += f'''
+        parts.append(f'''
             <div class="image-metadata">
                 <p>Dimensions: {image_data['metadata']['width']}×{image_data['metadata']['height']}</p>
                 <p>Format: {image_data['metadata']['format']}</p>
                 <p>Size: {image_data['size'] / 1024:.1f} KB</p>
             </div>
         </div>
-        '''
+        ''')
+        content = ''.join(parts)
 
         return {
             'title': title,
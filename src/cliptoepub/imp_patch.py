@@ -38,8 +38,9 @@ def _new_module(name):
 
 
 def _install_shim():
-    # Do not override if a real 'imp' is already present
-    if 'imp' in sys.modules:
+    # Before 3.12 the real 'imp' exists and is imported on demand; also do
+    # not override a real 'imp' that is already present
+    if sys.version_info < (3, 12) or 'imp' in sys.modules:
         return
     m = ModuleType('imp')
     m.find_module = _find_module  # type: ignore[attr-defined]
@@ -50,4 +51,5 @@ def _install_shim():
     sys.modules['imp'] = m
 
 
-_install_shim()
+if sys.version_info >= (3, 12):
+    _install_shim()
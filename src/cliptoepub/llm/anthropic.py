@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from .base import LLMRequest, LLMProvider
+from .base import HTTPSessionMixin, LLMRequest, LLMProvider
 from ..llm_anthropic import process_text  # type: ignore[attr-defined]
 
 
-class AnthropicProvider(LLMProvider):
+class AnthropicProvider(HTTPSessionMixin, LLMProvider):
     def process(self, request: LLMRequest) -> str:
         return process_text(
             request.text,
@@ -16,6 +16,7 @@ class AnthropicProvider(LLMProvider):
             temperature=request.temperature,
             timeout_s=request.timeout_s,
             retries=request.retries,
+            session=self._get_session(request),
         )
 
 
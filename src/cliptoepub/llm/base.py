@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Any, Protocol
 
 
 @dataclass
@@ -15,11 +15,40 @@ class LLMRequest:
     temperature: float
     timeout_s: int
     retries: int
+    # Optional httpx.Client to send the request through; providers fall back
+    # to their own pooled client when this is None
+    session: Any = None
 
 
 class LLMProvider(Protocol):
     def process(self, request: LLMRequest) -> str: ...
 
 
-__all__ = ["LLMRequest", "LLMProvider"]
+class HTTPSessionMixin:
+    """Give a provider one httpx.Client, created on first use.
 
+    Reusing the provider reuses the client's keep-alive connections, so
+    repeat requests (and retries) skip the TCP/TLS handshake. Call close()
+    when the provider is no longer needed.
+    """
+
+    _session: Any = None
+
+    def _get_session(self, request: LLMRequest) -> Any:
+        if request.session is not None:
+            return request.session
+        if self._session is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+            self._session = httpx.Client()
+        return self._session
+
+    def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+__all__ = ["LLMRequest", "LLMProvider", "HTTPSessionMixin"]
@@ -3,22 +3,41 @@ from __future__ import annotations
 
 from typing import Optional
 
-from .base import LLMRequest, LLMProvider
-from ..llm_anthropic import _process_via_openrouter, AnthropicAuthOrConfigError, AnthropicRecoverableError  # type: ignore[attr-defined]
+from .base import HTTPSessionMixin, LLMRequest, LLMProvider
+from ..llm_anthropic import (  # type: ignore[attr-defined]
+    AnthropicAuthOrConfigError,
+    AnthropicRecoverableError,
+    _process_via_openrouter,
+    _sleep_backoff,
+)
 
 
-class OpenRouterProvider(LLMProvider):
+class OpenRouterProvider(HTTPSessionMixin, LLMProvider):
     def process(self, request: LLMRequest) -> str:
-        return _process_via_openrouter(
-            request.text,
-            api_key=request.api_key or None,
-            model=request.model,
-            system_prompt=request.system_prompt,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-            timeout_s=request.timeout_s,
-            retries=request.retries,
-        )
+        # Retries are driven here rather than inside _process_via_openrouter
+        # (called with retries=0): configuration/auth errors fail on the first
+        # attempt, transient ones back off with jitter before the next try.
+        session = self._get_session(request)
+        for attempt in range(request.retries + 1):
+            try:
+                return _process_via_openrouter(
+                    request.text,
+                    api_key=request.api_key or None,
+                    model=request.model,
+                    system_prompt=request.system_prompt,
+                    max_tokens=request.max_tokens,
+                    temperature=request.temperature,
+                    timeout_s=request.timeout_s,
+                    retries=0,
+                    session=session,
+                )
+            except AnthropicAuthOrConfigError:
+                raise
+            except AnthropicRecoverableError:
+                if attempt >= request.retries:
+                    raise
+                _sleep_backoff(attempt)
+        raise AnthropicRecoverableError("Exhausted retries for OpenRouter request")
 
 
 __all__ = ["OpenRouterProvider"]
@@ -70,6 +70,16 @@ def _is_recoverable(exc: Exception, status_code: Optional[int] = None) -> bool:
     return any(tok in text for tok in recoverable_tokens)
 
 
+def _post(session, url: str, headers: dict, payload: dict, timeout_s: int):
+    """POST JSON through ``session`` if given, else through a one-off httpx client."""
+    if session is not None:
+        return session.post(url, headers=headers, json=payload, timeout=timeout_s)
+    import httpx
+
+    with httpx.Client(timeout=timeout_s) as client:
+        return client.post(url, headers=headers, json=payload)
+
+
 def _process_via_openrouter(
     text: str,
     *,
@@ -80,6 +90,7 @@ def _process_via_openrouter(
     temperature: float = 0.2,
     timeout_s: int = 60,
     retries: int = 10,
+    session=None,
 ) -> str:
     """Send text via OpenRouter Chat Completions API.
 
@@ -88,13 +99,13 @@ def _process_via_openrouter(
       'anthropic/claude-sonnet-4.5' (1M context window, provider-dependent access).
     - Uses OPENROUTER_API_KEY from environment if api_key is None/empty.
     - Expects OpenAI-compatible response with choices[0].message.content.
+    - Sends through ``session`` (an httpx.Client) when given, so retries and
+      repeat calls reuse its connections; otherwise uses a one-off client.
     """
     key = (api_key or "").strip() or os.environ.get("OPENROUTER_API_KEY", "").strip()
     if not key:
         raise AnthropicAuthOrConfigError("Missing OPENROUTER_API_KEY for OpenRouter request")
 
-    import httpx
-
     # Build OpenAI-compatible chat request
     messages = []
     if system_prompt:
@@ -119,8 +130,7 @@ def _process_via_openrouter(
     last_exc: Optional[Exception] = None
     for attempt in range(retries + 1):
         try:
-            with httpx.Client(timeout=timeout_s) as client:
-                resp = client.post(url, headers=headers, json=payload)
+            resp = _post(session, url, headers, payload, timeout_s)
             if resp.status_code in (401, 403):
                 raise AnthropicAuthOrConfigError("OpenRouter authentication failed or access denied")
             if resp.status_code >= 400:
@@ -173,12 +183,14 @@ def process_text(
     temperature: float = 0.2,
     timeout_s: int = 60,
     retries: int = 10,
+    session=None,
 ) -> str:
     """
     Send text to Anthropic Messages API and return Markdown.
 
     Raises AnthropicAuthOrConfigError on 401/403 and AnthropicRecoverableError
-    after all retries are exhausted for transient errors.
+    after all retries are exhausted for transient errors. When ``session`` (an
+    httpx.Client) is given, both the SDK and the REST fallback send through it.
     """
     if not model or not system_prompt:
         raise AnthropicAuthOrConfigError("Missing model or system prompt")
@@ -201,7 +213,10 @@ def process_text(
     for attempt in range(retries + 1):
         try:
             if have_sdk:
-                client = Anthropic(api_key=api_key)
+                if session is not None:
+                    client = Anthropic(api_key=api_key, http_client=session)
+                else:
+                    client = Anthropic(api_key=api_key)
                 message = client.messages.create(
                     model=model,
                     max_tokens=max_tokens,
@@ -215,8 +230,6 @@ def process_text(
                     md = ""
                 return md
             else:
-                import httpx
-
                 headers = {
                     "content-type": "application/json",
                     "x-api-key": api_key,
@@ -231,8 +244,7 @@ def process_text(
                     "temperature": float(temperature),
                 }
                 url = "https://api.anthropic.com/v1/messages"
-                with httpx.Client(timeout=timeout_s) as client:
-                    resp = client.post(url, headers=headers, json=payload)
+                resp = _post(session, url, headers, payload, timeout_s)
                 if resp.status_code in (401, 403):
                     raise AnthropicAuthOrConfigError("Anthropic authentication failed or access denied")
                 if resp.status_code >= 400:
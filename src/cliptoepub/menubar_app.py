@@ -21,7 +21,7 @@ import pync
 
 from .converter import ClipboardToEpubConverter
 from . import paths as paths
-from .hotkeys import parse_hotkey_string
+from .hotkeys import HotkeyMatcher, parse_hotkey_string
 from .llm_config import (
     ensure_llm_config,
     get_prompt_menu_items,
@@ -160,7 +160,7 @@ class ClipToEpubApp(rumps.App):
 
         # Setup LLM hotkey listener
         self.llm_listener = None
-        self.llm_current_keys = set()
+        self.llm_hotkey_matcher = None
         # Defer LLM hotkey creation until the app event loop is running
         # to avoid macOS Abort trap crashes from early event taps.
         try:
@@ -664,18 +664,16 @@ class ClipToEpubApp(rumps.App):
             print("Quartz keyboard APIs missing; disabling LLM hotkey listener")
             return
 
-        self.llm_hotkey = parse_hotkey_string(self.config.get("anthropic_hotkey", "cmd+shift+l")) or set()
+        self.llm_hotkey = parse_hotkey_string(self.config.get("anthropic_hotkey", "cmd+shift+l")) or frozenset()
+        matcher = HotkeyMatcher(self.llm_hotkey)
+        self.llm_hotkey_matcher = matcher
 
         def on_press(key):
-            self.llm_current_keys.add(key)
-            if self.llm_hotkey and self.llm_hotkey.issubset(self.llm_current_keys):
+            if matcher.press(key):
                 self.convert_with_llm()
 
         def on_release(key):
-            try:
-                self.llm_current_keys.remove(key)
-            except KeyError:
-                pass
+            matcher.release(key)
 
         try:
             if self.llm_listener:
@@ -713,7 +711,6 @@ class ClipToEpubApp(rumps.App):
                 if self.llm_listener:
                     self.llm_listener.stop()
                     self.llm_listener = None
-                self.llm_current_keys = set()
                 self._setup_llm_hotkey()
             except Exception as e:
                 print(f"Warning: Could not restart LLM hotkey: {e}")
@@ -797,8 +794,11 @@ if __name__ == "__main__":
     )
     is_frozen = bool(getattr(sys, 'frozen', False))
     if not is_venv and not is_frozen:
-        print("Warning: Not running in a virtual environment.")
-        print("It's recommended to: source venv/bin/activate")
+        sys.stdout.write(
+            "Warning: Not running in a virtual environment.\n"
+            "It's recommended to: source venv/bin/activate\n"
+        )
+        sys.stdout.flush()
         # Continue without exiting to support non-venv runs
 
     # Create and run the app
@@ -34,7 +34,7 @@ except Exception as e:
 
 from . import paths as paths
 from .converter import ClipboardToEpubConverter
-from .hotkeys import parse_hotkey_string
+from .hotkeys import HotkeyMatcher, parse_hotkey_string
 from .llm_config import (
     ensure_llm_config,
     get_prompt_menu_items,
@@ -162,7 +162,7 @@ class WindowsTrayApp:
 
         # LLM hotkey listener
         self.llm_listener = None
-        self.llm_current_keys = set()
+        self.llm_hotkey_matcher = None
         self._setup_llm_hotkey()
         # Hook activity callback for on-change refresh
         try:
@@ -539,19 +539,17 @@ class WindowsTrayApp:
             print(f"LLM hotkey setup skipped: {e}")
             return
 
-        combo = parse_hotkey_string(self.config.get("anthropic_hotkey")) or set()
+        combo = parse_hotkey_string(self.config.get("anthropic_hotkey")) or frozenset()
         self.llm_hotkey = combo
+        matcher = HotkeyMatcher(combo)
+        self.llm_hotkey_matcher = matcher
 
         def on_press(key):
-            self.llm_current_keys.add(key)
-            if self.llm_hotkey and self.llm_hotkey.issubset(self.llm_current_keys):
+            if matcher.press(key):
                 self._convert_with_llm()
 
         def on_release(key):
-            try:
-                self.llm_current_keys.remove(key)
-            except KeyError:
-                pass
+            matcher.release(key)
 
         try:
             if self.llm_listener:
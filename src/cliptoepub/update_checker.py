@@ -51,7 +51,7 @@ class UpdateChecker:
                 with open(self.UPDATE_CHECK_FILE, 'r') as f:
                     return json.load(f)
         except Exception as e:
-            logger.error(f"Error loading update check data: {e}")
+            logger.error("Error loading update check data: %s", e)
 
         return {
             'last_check': None,
@@ -66,7 +66,7 @@ class UpdateChecker:
             with open(self.UPDATE_CHECK_FILE, 'w') as f:
                 json.dump(self.last_check_data, f, indent=2)
         except Exception as e:
-            logger.error(f"Error saving update check data: {e}")
+            logger.error("Error saving update check data: %s", e)
 
     def should_check_for_updates(self) -> bool:
         """Determine if we should check for updates"""
@@ -82,7 +82,7 @@ class UpdateChecker:
             time_since_check = datetime.now() - last_check_time
             return time_since_check > timedelta(hours=self.CHECK_INTERVAL_HOURS)
         except (ValueError, TypeError) as e:
-            logger.debug(f"Invalid last_check timestamp: {e}")
+            logger.debug("Invalid last_check timestamp: %s", e)
             return True
 
     def parse_version(self, version_string: str) -> tuple:
@@ -100,7 +100,7 @@ class UpdateChecker:
         try:
             return tuple(int(p) for p in parts[:3])
         except (ValueError, IndexError, AttributeError) as e:
-            logger.debug(f"Invalid version string '{version_string}': {e}")
+            logger.debug("Invalid version string '%s': %s", version_string, e)
             return (0, 0, 0)
 
     def check_for_updates(self, force: bool = False) -> Optional[Dict]:
@@ -163,7 +163,7 @@ class UpdateChecker:
                     }
 
                     self._save_check_data()
-                    logger.info(f"Update available: {latest_version}")
+                    logger.info("Update available: %s", latest_version)
                     return update_info
                 else:
                     # No update available
@@ -173,9 +173,9 @@ class UpdateChecker:
                     return None
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error checking for updates: {e}")
+            logger.error("Network error checking for updates: %s", e)
         except Exception as e:
-            logger.error(f"Error checking for updates: {e}")
+            logger.error("Error checking for updates: %s", e)
 
         return None
 
@@ -201,7 +201,7 @@ class UpdateChecker:
         self.last_check_data['dismissed_version'] = version
         self.last_check_data['available_version'] = None
         self._save_check_data()
-        logger.info(f"Dismissed update {version}")
+        logger.info("Dismissed update %s", version)
 
     def is_dismissed(self, version: str) -> bool:
         """
@@ -233,7 +233,7 @@ class UpdateChecker:
                 f"ClipboardToEpub-update-{datetime.now().strftime('%Y%m%d%H%M%S')}.dmg"
             )
 
-            logger.info(f"Downloading update from {download_url}")
+            logger.info("Downloading update from %s", download_url)
 
             response = requests.get(download_url, stream=True, timeout=20)
             response.raise_for_status()
@@ -249,11 +249,11 @@ class UpdateChecker:
                         if progress_callback:
                             progress_callback(downloaded, total_size)
 
-            logger.info(f"Download complete: {download_path}")
+            logger.info("Download complete: %s", download_path)
             return download_path
 
         except Exception as e:
-            logger.error(f"Error downloading update: {e}")
+            logger.error("Error downloading update: %s", e)
             return None
 
     def open_download_page(self, url: Optional[str] = None):
@@ -264,7 +264,7 @@ class UpdateChecker:
             url: URL to open (defaults to releases page)
         """
         url = url or self.RELEASES_PAGE
-        logger.info(f"Opening download page: {url}")
+        logger.info("Opening download page: %s", url)
         webbrowser.open(url)
 
     def install_update(self, dmg_path: Path) -> bool:
@@ -278,11 +278,11 @@ class UpdateChecker:
             True if successful
         """
         try:
-            logger.info(f"Opening DMG for installation: {dmg_path}")
+            logger.info("Opening DMG for installation: %s", dmg_path)
             subprocess.run(['open', str(dmg_path)], check=True)
             return True
         except Exception as e:
-            logger.error(f"Error opening DMG: {e}")
+            logger.error("Error opening DMG: %s", e)
             return False
 
     def get_update_message(self, update_info: Dict) -> str:
@@ -68,3 +68,35 @@ def test_process_clipboard_content_sets_metadata_and_toc_when_forced() -> None:
     assert toc_html is not None
     assert 'href="#chapter_1"' in toc_html
     assert "body" in result["css"].lower()
+
+
+def test_content_detector_only_probes_the_start_of_long_clips() -> None:
+    probe = content_processor.DETECTION_PROBE_CHARS
+    tail = "plain words " * (probe // 6)
+
+    assert ContentDetector.detect_format("<div><p>Intro</p></div>\n" + tail) == "html"
+    assert ContentDetector.detect_format("# Title\n\n**bold** start\n" + tail) == "markdown"
+    # Signatures that only appear past the probe do not change the result
+    assert ContentDetector.detect_format("x" * probe + "<div><p>late</p></div>") == "plain"
+
+
+def test_process_clipboard_content_reuses_conversion_of_repeated_content(monkeypatch) -> None:
+    calls = []
+    original_convert = ContentConverter.convert
+
+    def counting_convert(self, content, format_type):
+        calls.append(format_type)
+        return original_convert(self, content, format_type)
+
+    monkeypatch.setattr(ContentConverter, "convert", counting_convert)
+    content = "# Memo Title\n\nA paragraph that only this test converts."
+
+    first = process_clipboard_content(content, options={"css_template": "minimal"})
+    first["metadata"]["title"] = "changed by caller"
+    second = process_clipboard_content(content, options={"css_template": "modern"})
+
+    assert calls == ["markdown"]
+    assert second["format"] == "markdown"
+    assert second["metadata"]["title"] == "Memo Title"
+    assert second["chapters"] == process_clipboard_content(content)["chapters"]
+    assert second["css"] != first["css"]
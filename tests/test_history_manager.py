@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+
+from cliptoepub.history_manager import ClipboardAccumulator, ConversionHistory
+
+
+def _saved_titles(path) -> list:
+    if not path.exists():
+        return []
+    return [entry["title"] for entry in json.loads(path.read_text(encoding="utf-8"))]
+
+
+def _expected_combined(accumulator: ClipboardAccumulator, separator: str = "\n\n---\n\n") -> str:
+    parts = []
+    for clip in accumulator.get_clips():
+        stamp = datetime.fromisoformat(clip["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        parts.append(f"[Clipped at {stamp}]\n\n{clip['content']}")
+    return separator.join(parts)
+
+
+def test_history_batches_saves_and_flush_writes_pending(tmp_path) -> None:
+    history_file = tmp_path / "history.json"
+    history = ConversionHistory(history_file, save_every=3)
+
+    history.add_entry(str(tmp_path / "a.epub"), {"title": "A"})
+    history.add_entry(str(tmp_path / "b.epub"), {"title": "B"})
+    assert _saved_titles(history_file) == []
+
+    history.add_entry(str(tmp_path / "c.epub"), {"title": "C"})
+    assert _saved_titles(history_file) == ["C", "B", "A"]
+
+    history.add_entry(str(tmp_path / "d.epub"), {"title": "D"})
+    assert _saved_titles(history_file) == ["C", "B", "A"]
+
+    history.flush()
+    assert _saved_titles(history_file) == ["D", "C", "B", "A"]
+    reloaded = ConversionHistory(history_file, save_every=3)
+    assert [entry["title"] for entry in reloaded.get_recent()] == ["D", "C", "B", "A"]
+
+
+def test_history_flush_without_pending_entries_does_not_write(tmp_path) -> None:
+    history_file = tmp_path / "history.json"
+    history = ConversionHistory(history_file, save_every=3)
+
+    history.flush()
+    assert not history_file.exists()
+
+
+def test_accumulator_returns_existing_clip_for_duplicate_content() -> None:
+    accumulator = ClipboardAccumulator()
+
+    first = accumulator.add_clip("same text")
+    assert accumulator.add_clip("same text") is first
+    assert len(accumulator.get_clips()) == 1
+
+
+def test_accumulator_combined_output_survives_remove_and_trim() -> None:
+    accumulator = ClipboardAccumulator(max_clips=3)
+    clips = [accumulator.add_clip(text) for text in ("one", "two", "three")]
+    assert accumulator.combine_clips() == _expected_combined(accumulator)
+
+    assert accumulator.remove_clip(clips[1]["id"]) is True
+    assert [clip["content"] for clip in accumulator.get_clips()] == ["one", "three"]
+    assert accumulator.combine_clips() == _expected_combined(accumulator)
+
+    accumulator.add_clip("four")
+    accumulator.add_clip("five")
+    assert [clip["content"] for clip in accumulator.get_clips()] == ["three", "four", "five"]
+    assert accumulator.combine_clips(separator="\n") == _expected_combined(accumulator, "\n")
+
+    # A clip trimmed past max_clips is no longer treated as a duplicate
+    readded = accumulator.add_clip("one")
+    assert readded is not clips[0]
+    assert [clip["content"] for clip in accumulator.get_clips()] == ["four", "five", "one"]
+    assert accumulator.combine_clips() == _expected_combined(accumulator)
+
+
+def test_accumulator_clear_resets_duplicate_tracking() -> None:
+    accumulator = ClipboardAccumulator()
+    first = accumulator.add_clip("text")
+
+    accumulator.clear()
+    assert accumulator.combine_clips() == ""
+
+    again = accumulator.add_clip("text")
+    assert again is not first
+    assert accumulator.combine_clips() == _expected_combined(accumulator)
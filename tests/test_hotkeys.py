@@ -0,0 +1,52 @@
+from cliptoepub.hotkeys import HotkeyMatcher, MultiHotkeyMatcher
+
+
+def test_hotkey_matcher_fires_once_when_combo_completes() -> None:
+    matcher = HotkeyMatcher(["cmd", "shift", "l"])
+
+    assert matcher.press("cmd") is False
+    assert matcher.press("x") is False
+    assert matcher.press("shift") is False
+    assert matcher.press("l") is True
+    # Auto-repeat while the combo is held does not fire again
+    assert matcher.press("l") is False
+
+    matcher.release("l")
+    assert matcher.press("l") is True
+
+
+def test_hotkey_matcher_release_and_reset_clear_state() -> None:
+    matcher = HotkeyMatcher(["ctrl", "e"])
+
+    matcher.press("ctrl")
+    matcher.release("ctrl")
+    assert matcher.press("e") is False
+
+    matcher.press("ctrl")
+    matcher.reset()
+    matcher.release("e")
+    assert matcher.press("e") is False
+    assert matcher.press("ctrl") is True
+
+
+def test_hotkey_matcher_with_empty_combo_never_fires() -> None:
+    matcher = HotkeyMatcher([])
+
+    assert matcher.press("a") is False
+
+
+def test_multi_hotkey_matcher_reports_completed_combos() -> None:
+    matcher = MultiHotkeyMatcher([["cmd", "shift", "e"], ["cmd", "shift", "a"], []])
+
+    assert matcher.press("cmd") == ()
+    assert matcher.press("shift") == ()
+    assert matcher.press("x") == ()
+    assert matcher.press("a") == (1,)
+    assert matcher.press("a") == ()
+    assert matcher.press("e") == (0,)
+
+    matcher.release("shift")
+    assert matcher.press("shift") == (0, 1)
+
+    matcher.reset()
+    assert matcher.press("e") == ()